@@ -1,25 +1,45 @@
 # driver_factory.py
 import os
+import re
 import logging
+import copy
 import json
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
-from dotenv import load_dotenv
+from typing import Any, Iterable, Optional
+from urllib.request import urlopen
+
+try:  # optional – much faster (de)serialisation of the large Preferences file
+    import orjson
+except ImportError:  # pragma: no cover – stdlib fallback
+    orjson = None
 
 # Selenium imports
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import NoSuchWindowException
-
-# Optional auto-downloader (fallback when our own patcher is not used)
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import NoSuchWindowException, WebDriverException
 
 # 🆕  Stealth patcher – download **and** patch a compatible driver in one go
 from Auferstehung.patcher import get_patched_chromedriver
 
 # Load environment variables
-load_dotenv()
+def _load_dotenv_if_present() -> None:
+    """Load `.env` from the CWD or the project root.
+
+    Callers read BRAVE_* variables right after importing this package, so
+    this still runs at import – but the dotenv import and its parent-directory
+    walk are skipped when there is no `.env` to load.  (GravBotDriver imports
+    this package lazily and loads `.env` itself before reading BRAVE_*.)
+    """
+    for candidate in (Path.cwd() / ".env", Path(__file__).resolve().parent.parent / ".env"):
+        if candidate.is_file():
+            from dotenv import load_dotenv
+            load_dotenv(candidate)
+            return
+
+_load_dotenv_if_present()
 
 # ------------------------------------------------------------------
 # 1️⃣  Helpers – **absolute** import works for a flat‑folder layout
@@ -34,6 +54,35 @@ log = logging.getLogger(__name__)
 # ------------------------------------------------------------------
 # 0️⃣  Profile helper – prevent Brave from restoring old tabs
 # ------------------------------------------------------------------
+def _atomic_write_bytes(target: Path, data: bytes) -> None:
+    """Write *data* to a sibling temp file, fsync it and swap it in with
+    `os.replace` – a crash mid-write leaves the original file intact."""
+    tmp_file = target.with_name(target.name + ".tmp")
+    try:
+        with open(tmp_file, "wb", buffering=1 << 20) as fh:
+            fh.write(data)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_file, target)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+def _fast_json_load(data: bytes) -> Any:
+    """Parse JSON straight from bytes – orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _fast_json_dump(obj: Any) -> bytes:
+    """Serialise compactly (no indent) – Chrome writes Preferences this way too."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+_EXIT_TYPE_RE = re.compile(rb'"exit_type"\s*:\s*"([^"]*)"')
+_EXIT_TYPE_MARKER = ".exit_type_ok"
+
 def _fix_exit_type(user_data_dir: Path, profile_name: str = "Default") -> None:
     """Ensure the profile's *exit_type* is set to *CleanExit*.
 
@@ -42,22 +91,43 @@ def _fix_exit_type(user_data_dir: Path, profile_name: str = "Default") -> None:
     value becomes "Crashed" and the next launch will auto-restore all tabs –
     exactly what we *do not* want in automated tests.  UC solves this by
     resetting the flag; we replicate that here.
+
+    Preferences is often >1 MB, so the value is patched in the raw bytes; the
+    full JSON round-trip is only used when the key is missing.  A sidecar
+    file next to it remembers the mtime at which the profile was last known
+    clean, so a warm, untouched profile costs a single `stat`.
     """
     pref_file = user_data_dir / profile_name / "Preferences"
+    marker_file = pref_file.with_name(_EXIT_TYPE_MARKER)
     try:
         if not pref_file.is_file():
             return  # nothing to do – fresh profile
 
-        prefs = json.loads(pref_file.read_text(encoding="utf-8"))
-        if prefs.get("profile", {}).get("exit_type") != "CleanExit":
-            prefs.setdefault("profile", {})["exit_type"] = "CleanExit"
-            pref_file.write_text(json.dumps(prefs, indent=2), encoding="utf-8")
+        try:
+            if marker_file.read_text(encoding="utf-8") == str(pref_file.stat().st_mtime_ns):
+                return  # unchanged since we last saw CleanExit
+        except OSError:
+            pass
+
+        data = pref_file.read_bytes()
+        match = _EXIT_TYPE_RE.search(data)
+        if not (match and match.group(1) == b"CleanExit"):
+            if match:
+                data = data[:match.start()] + b'"exit_type":"CleanExit"' + data[match.end():]
+            else:
+                prefs = _fast_json_load(data)
+                prefs.setdefault("profile", {})["exit_type"] = "CleanExit"
+                data = _fast_json_dump(prefs)
+
+            _atomic_write_bytes(pref_file, data)
             log.debug("Reset profile exit_type → CleanExit to avoid session restore")
+
+        marker_file.write_text(str(pref_file.stat().st_mtime_ns), encoding="utf-8")
     except Exception as exc:  # pragma: no cover – safety net
         log.warning("Failed to set exit_type=CleanExit (non-fatal): %s", exc)
 
 # ------------------------------------------------------------------
-# 2️⃣  CDP script injector (used by every mask)
+# 2️⃣  CDP script injectors (used by apply_stealth)
 # ------------------------------------------------------------------
 def _add_script(driver, js_source: str) -> None:
     try:
@@ -78,16 +148,132 @@ def _add_script(driver, js_source: str) -> None:
             "Page.addScriptToEvaluateOnNewDocument",
             {"source": js_source},
         )
+    except WebDriverException as exc:
+        # No pre-navigation happens at startup any more – if the first window
+        # is not ready yet, settle it on about:blank and retry once.
+        log.debug("CDP inject failed (%s) – navigating to about:blank and retrying", exc)
+        driver.get("about:blank")
+        driver.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument",
+            {"source": js_source},
+        )
 
     log.debug("Injected script (first 80 chars): %s", js_source[:80].replace("\n", " "))
 
+def _open_devtools_socket(driver):
+    """Open a raw DevTools WebSocket to the driver's current page target.
+
+    Skips the Python → chromedriver HTTP → CDP bridge hop of
+    `execute_cdp_cmd`.  Returns *None* when unavailable so callers can fall
+    back.  The socket must stay open for the driver's lifetime: Chrome drops
+    injected scripts and emulation overrides when their session detaches.
+    """
+    try:
+        import websocket  # websocket-client – installed alongside Selenium 4
+
+        address = driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+        with urlopen(f"http://{address}/json/list", timeout=2) as resp:
+            targets = json.loads(resp.read())
+        # chromedriver window handles are the DevTools target ids.  No match
+        # means we cannot tell which tab is ours (e.g. restored profile tabs)
+        # – never guess, let the caller use execute_cdp_cmd instead.
+        handle = driver.current_window_handle
+        target = next((t for t in targets if t.get("id") == handle), None)
+        if target is None:
+            log.debug("No DevTools target for window %s – using execute_cdp_cmd", handle)
+            return None
+        return websocket.create_connection(
+            target["webSocketDebuggerUrl"], timeout=5, suppress_origin=True,
+        )
+    except Exception as exc:
+        log.debug("Direct DevTools socket unavailable (%s) – using execute_cdp_cmd", exc)
+        return None
+
+def _close_devtools_socket_on_quit(driver) -> None:
+    """Wrap ``driver.quit`` so the kept-alive DevTools socket is closed with
+    the browser instead of leaking for the rest of the process."""
+    original_quit = driver.quit
+
+    def quit_and_close_socket():
+        ws = getattr(driver, "_stealth_devtools_ws", None)
+        driver._stealth_devtools_ws = None
+        if ws is not None:
+            try:
+                ws.close()
+            except Exception as exc:
+                log.debug("Closing DevTools socket failed: %s", exc)
+        original_quit()
+
+    driver.quit = quit_and_close_socket
+
+def _send_cdp_pipelined(ws, commands) -> None:
+    """Send every ``(method, params)`` in *commands* without waiting in
+    between, then collect the replies – one socket RTT for the whole batch."""
+    pending = {}
+    for msg_id, (method, params) in enumerate(commands, start=1):
+        ws.send(json.dumps({"id": msg_id, "method": method, "params": params}))
+        pending[msg_id] = method
+    while pending:
+        reply = json.loads(ws.recv())
+        method = pending.pop(reply.get("id"), None)   # events carry no id
+        if method and "error" in reply:
+            raise WebDriverException(f"{method} failed: {reply['error']}")
+
 # ------------------------------------------------------------------
-# 3️⃣  Stealth‑mask functions (unchanged except for viewport)
+# 3️⃣  Stealth‑mask sources – frozen at import time
 # ------------------------------------------------------------------
-def mask_webdriver(driver) -> None:
-    _add_script(
-        driver,
-        """
+# Static masks are plain constants; the two dynamic ones (viewport and
+# hardware/timezone) are `str.format` templates, so braces are doubled.
+# Every source is minified once here to cut the bytes sent over CDP.
+
+def _minify_js(js_source: str) -> str:
+    """Strip comments and indentation from the hand-written masks below.
+
+    Not a general-purpose minifier: string literals are kept verbatim and any
+    whitespace run containing a newline collapses to a single newline, so
+    automatic semicolon insertion behaves exactly as in the original source.
+    """
+    out = []
+    i, n = 0, len(js_source)
+    quote = None
+    while i < n:
+        ch = js_source[i]
+        if quote:
+            out.append(ch)
+            if ch == "\\" and i + 1 < n:
+                out.append(js_source[i + 1])
+                i += 1
+            elif ch == quote:
+                quote = None
+            i += 1
+        elif ch in "'\"`":
+            quote = ch
+            out.append(ch)
+            i += 1
+        elif js_source.startswith("//", i):
+            i = js_source.find("\n", i)
+            i = n if i == -1 else i
+        elif js_source.startswith("/*", i):
+            end = js_source.find("*/", i + 2)
+            i = n if end == -1 else end + 2
+        elif ch.isspace():
+            start = i
+            while i < n and js_source[i].isspace():
+                i += 1
+            gap = "\n" if "\n" in js_source[start:i] else " "
+            # Merge with a gap left just before a removed comment
+            if out and out[-1] in (" ", "\n"):
+                if gap == "\n":
+                    out[-1] = gap
+            else:
+                out.append(gap)
+        else:
+            out.append(ch)
+            i += 1
+    return "".join(out).strip()
+
+# navigator.webdriver
+_MASK_WEBDRIVER_JS = _minify_js("""
         (function () {
             // Remove navigator.webdriver entirely (prototype and instance)
             try {
@@ -97,14 +283,10 @@ def mask_webdriver(driver) -> None:
                 delete navigator.webdriver;
             } catch (e) {}
         })();
-        """
-    )
+        """)
 
-def mask_languages_and_plugins(driver) -> None:
-    """Set realistic, consistent language and plugin values"""
-    _add_script(
-        driver,
-        """
+# Realistic, consistent language and plugin values
+_MASK_LANGUAGES_AND_PLUGINS_JS = _minify_js("""
         Object.defineProperty(navigator, 'languages', {
           get: () => ['en-US', 'en']
         });
@@ -128,24 +310,10 @@ def mask_languages_and_plugins(driver) -> None:
           });
           Object.defineProperty(navigator, 'plugins', { get: () => fakePlugins });
         }
-        """
-    )
+        """)
 
-def mask_viewport(driver, *, apply_viewport: bool = True) -> None:
-    """
-    Set consistent viewport size based on profile.
-    UC approach: Use consistent viewport per profile, same "device" every session.
-    When you want the window to stay maximized, call with apply_viewport=False.
-    """
-    if not apply_viewport:
-        log.debug("Viewport mask disabled – keeping browser's original size.")
-        return
-
-    w, h, dpr = get_consistent_viewport()
-    driver.set_window_size(w, h)
-    _add_script(
-        driver,
-        f"""
+# Consistent viewport per profile – same "device" every session
+_MASK_VIEWPORT_TEMPLATE = _minify_js("""
         Object.defineProperty(window, 'devicePixelRatio', {{
           get: () => {dpr}
         }});
@@ -161,17 +329,12 @@ def mask_viewport(driver, *, apply_viewport: bool = True) -> None:
           get: () => {w}
         }});
         Object.defineProperty(screen, 'availHeight', {{
-          get: () => {h - 40}  // Account for taskbar
+          get: () => {avail_h}  // Account for taskbar
         }});
-        """
-    )
-    log.debug("Consistent viewport set to %dx%d, DPR %.1f", w, h, dpr)
+        """)
 
-def mask_webgl(driver) -> None:
-    """Enhanced WebGL spoofing with WebGL2 support (inspired by Claude)"""
-    _add_script(
-        driver,
-        """
+# Enhanced WebGL spoofing with WebGL2 support (inspired by Claude)
+_MASK_WEBGL_JS = _minify_js("""
         (function () {
             const getParameter = WebGLRenderingContext.prototype.getParameter;
             
@@ -203,72 +366,39 @@ def mask_webgl(driver) -> None:
                 WebGL2RenderingContext.prototype.getParameter = getParameterProxy(WebGL2RenderingContext.prototype.getParameter);
             }
         })();
-        """
-    )
+        """)
 
 # Canvas protection removed - UC approach: let canvas render naturally
 # Consistent fingerprints = same "device" = safer for account security
 
-def mask_audio_context(driver) -> None:
-    _add_script(
-        driver,
-        """
+_MASK_AUDIO_CONTEXT_JS = _minify_js("""
         (function () {
             const getChannelData = AudioBuffer.prototype.getChannelData;
             AudioBuffer.prototype.getChannelData = function () {
                 return new Float32Array(this.length);   // deterministic zeros
             };
         })();
-        """
-    )
+        """)
 
-def mask_hardware_and_timezone(driver) -> None:
-    """
-    Use consistent system-based hardware and timezone info.
-    UC approach: Match actual system specs rather than random values.
-    """
-    # Get consistent hardware specs (same per profile)
-    cpu_cores, memory_gb = get_consistent_hardware()
-    
-    # Get actual system timezone (most realistic)
-    tz = get_system_timezone()
-    
-    # Calculate timezone offset using improved method (handles DST)
-    offset = get_system_timezone_offset()
-    
-    # Set consistent hardware specs
-    _add_script(
-        driver,
-        f"""
+# Consistent system-based hardware and timezone (not random values)
+_MASK_HARDWARE_AND_TIMEZONE_TEMPLATE = _minify_js("""
         Object.defineProperty(navigator, 'hardwareConcurrency', {{get:()=>{cpu_cores}}});
         Object.defineProperty(navigator, 'deviceMemory', {{get:()=>{memory_gb}}});
-        """
-    )
-    
-    # Set system timezone (not random)
-    _add_script(
-        driver,
-        f"""
+
         Intl.DateTimeFormat.prototype.resolvedOptions = function() {{
             return {{timeZone: '{tz}'}};
         }};
         const RealDate = Date;
         class MockDate extends RealDate {{
             constructor(...args) {{ super(...args);
-                Object.defineProperty(this,'getTimezoneOffset',{{value:()=>{offset}}});
+                Object.defineProperty(this,'getTimezoneOffset',{{value:()=>{tz_offset}}});
             }}
         }}
         window.Date = MockDate;
-        """
-    )
-    log.debug("Consistent hardware & timezone set (tz=%s, offset=%d, cores=%d, RAM=%dGB)", 
-              tz, offset, cpu_cores, memory_gb)
-
-def mask_misc(driver) -> None:
-    """Enhanced misc property spoofing (inspired by Claude's approach)"""
-    _add_script(
-        driver,
-        """
+        """)
+
+# Enhanced misc property spoofing (inspired by Claude's approach)
+_MASK_MISC_JS = _minify_js("""
         // Permissions - consistent denials for privacy-sensitive permissions
         const originalQuery = navigator.permissions.query;
         navigator.permissions.__proto__.query = function(parameters) {
@@ -291,27 +421,193 @@ def mask_misc(driver) -> None:
         Object.defineProperty(navigator, 'platform', {
             get: () => 'Win32'  // Consistent with Windows UA
         });
-        """
-    )
+        """)
+
+def _escape_braces(js_source: str) -> str:
+    return js_source.replace("{", "{{").replace("}", "}}")
 
-def apply_stealth(driver, *, apply_viewport: bool = True) -> None:
+def _build_stealth_template(*parts: str) -> str:
+    """Wrap every mask in its own try-block inside one IIFE so a mask that
+    throws (e.g. missing API in a sandboxed frame) does not skip the rest.
+
+    *parts* are already `str.format`‑safe (braces escaped or placeholders).
+    """
+    body = "\n".join("try {{" + part + "}} catch (e) {{}}" for part in parts)
+    return "(function () {{\n" + body + "\n}})();"
+
+_STEALTH_TEMPLATE = _build_stealth_template(
+    _escape_braces(_MASK_WEBDRIVER_JS),
+    _escape_braces(_MASK_LANGUAGES_AND_PLUGINS_JS),
+    "{viewport_js}",
+    _escape_braces(_MASK_WEBGL_JS),
+    _escape_braces(_MASK_AUDIO_CONTEXT_JS),
+    _MASK_HARDWARE_AND_TIMEZONE_TEMPLATE,
+    _escape_braces(_MASK_MISC_JS),
+)
+
+@functools.lru_cache(maxsize=64)
+def _build_stealth_script(viewport: Optional[tuple], cpu_cores: int, memory_gb: int,
+                          tz: str, tz_offset: int) -> str:
+    """Fill `_STEALTH_TEMPLATE` – memoised, since the same profile always
+    yields the same inputs and therefore a byte-identical script."""
+    viewport_js = ""
+    if viewport is not None:
+        w, h, dpr = viewport
+        viewport_js = _MASK_VIEWPORT_TEMPLATE.format(w=w, h=h, dpr=dpr, avail_h=h - 40)  # account for taskbar
+    return _STEALTH_TEMPLATE.format_map({
+        "viewport_js": viewport_js,
+        "cpu_cores": cpu_cores,
+        "memory_gb": memory_gb,
+        "tz": tz,
+        "tz_offset": tz_offset,
+    })
+
+def apply_stealth(driver, *, apply_viewport: bool = True, persistent: bool = True) -> None:
     """
     Run *all* stealth masks for consistent "device" fingerprint.
     The only mask you might want to skip is the viewport one – pass 
     `apply_viewport=False` to keep the window size you set (maximized).
+
+    With `persistent=False` the script is run once via `Runtime.evaluate` on
+    the current document instead of being re-run by Chrome on every frame
+    and navigation – cheaper for long sessions that stay on one page, but
+    any new document (including a navigation) is left unpatched.
     
+    All mask sources are joined into one script and installed with a single
+    `Page.addScriptToEvaluateOnNewDocument` call; the viewport size is applied
+    via `Emulation.setDeviceMetricsOverride`.  Both are pipelined over a
+    direct DevTools WebSocket when possible, else sent via `execute_cdp_cmd`.
+
     UC Philosophy: Same profile = same "device" = consistent fingerprint.
     """
-    mask_webdriver(driver)
-    mask_languages_and_plugins(driver)
-    mask_viewport(driver, apply_viewport=apply_viewport)   # <-- respects the flag
-    mask_webgl(driver)
-    # mask_canvas(driver) - REMOVED: UC approach is to let canvas render naturally
-    mask_audio_context(driver)
-    mask_hardware_and_timezone(driver)
-    mask_misc(driver)
+    commands = []
+    viewport = None
+    if apply_viewport:
+        viewport = get_consistent_viewport()
+        w, h, dpr = viewport
+        # CDP emulation instead of WebDriver's setWindowRect – same channel as
+        # the script install below and no window-manager round-trip.
+        commands.append(("Emulation.setDeviceMetricsOverride", {
+            "width": w,
+            "height": h,
+            "deviceScaleFactor": dpr,
+            "mobile": False,
+        }))
+        log.debug("Consistent viewport set to %dx%d, DPR %.1f", w, h, dpr)
+    else:
+        log.debug("Viewport mask disabled – keeping browser's original size.")
+
+    # Consistent hardware specs (same per profile) + actual system timezone
+    cpu_cores, memory_gb = get_consistent_hardware()
+    tz = get_system_timezone()
+    tz_offset = get_system_timezone_offset()   # handles DST
+
+    combined = _build_stealth_script(viewport, cpu_cores, memory_gb, tz, tz_offset)
+    if persistent:
+        commands.append(("Page.addScriptToEvaluateOnNewDocument", {"source": combined}))
+    else:
+        commands.append(("Runtime.evaluate", {"expression": combined, "awaitPromise": False}))
+
+    ws = _open_devtools_socket(driver)
+    if ws is not None:
+        try:
+            _send_cdp_pipelined(ws, commands)
+            driver._stealth_devtools_ws = ws   # keep the session (and its scripts) alive
+            _close_devtools_socket_on_quit(driver)
+        except Exception as exc:
+            log.debug("Pipelined DevTools inject failed (%s) – using execute_cdp_cmd", exc)
+            ws.close()
+            ws = None
+    if ws is None:
+        for method, params in commands:
+            if method == "Page.addScriptToEvaluateOnNewDocument":
+                _add_script(driver, params["source"])
+            else:
+                driver.execute_cdp_cmd(method, params)
+
+    log.debug("Consistent hardware & timezone set (tz=%s, offset=%d, cores=%d, RAM=%dGB)",
+              tz, tz_offset, cpu_cores, memory_gb)
     log.info("All stealth patches applied - consistent fingerprint established.")
 
+# ------------------------------------------------------------------
+# 3️⃣b Patched driver & Brave binary lookup – resolved once per process
+# ------------------------------------------------------------------
+@functools.lru_cache(maxsize=1)
+def _cached_patched_chromedriver() -> str:
+    return get_patched_chromedriver()
+
+def _patched_chromedriver_path() -> str:
+    """Return the patched chromedriver, re-resolving only when asked to via
+    ``UC_PATCHER_REFRESH=1`` or when the cached file has disappeared."""
+    if os.getenv("UC_PATCHER_REFRESH") == "1":
+        _cached_patched_chromedriver.cache_clear()
+    path = _cached_patched_chromedriver()
+    if not os.path.isfile(path):
+        _cached_patched_chromedriver.cache_clear()
+        path = _cached_patched_chromedriver()
+    return path
+
+@functools.lru_cache(maxsize=1)
+def _detect_brave_binary() -> Optional[str]:
+    """Auto-detect Brave browser on Windows – probed once per process."""
+    brave_paths = [
+        r"C:\Program Files\BraveSoftware\Brave-Browser\Application\brave.exe",
+        r"C:\Program Files (x86)\BraveSoftware\Brave-Browser\Application\brave.exe",
+        os.path.expanduser(r"~\AppData\Local\BraveSoftware\Brave-Browser\Application\brave.exe")
+    ]
+
+    brave_path = next((p for p in brave_paths if os.path.isfile(p)), None)
+    if brave_path:
+        log.info(f"Found Brave browser at: {brave_path}")
+    return brave_path
+
+def _maximise_window(driver) -> None:
+    """Maximise the window, falling back to 1280x720 when that fails.
+
+    No `get_window_size()` check afterwards – a failed maximise raises, and
+    that extra round-trip on every startup practically never caught anything.
+    """
+    try:
+        driver.maximize_window()
+        log.info("Browser window maximised via driver.maximize_window()")
+    except Exception as exc:   # pragma: no cover – safety net
+        log.warning("Failed to maximise window: %s", exc)
+        # Fallback to reasonable size
+        try:
+            driver.set_window_size(1280, 720)
+            log.info("Set fallback window size: 1280x720")
+        except Exception:
+            pass
+
+# ------------------------------------------------------------------
+# 3️⃣c Constant browser options – only proxy/profile/UA vary per driver
+# ------------------------------------------------------------------
+_BASE_ARGS = (
+    "--disable-blink-features=AutomationControlled",
+    "--disable-extensions",
+    "--disable-popup-blocking",
+    # Do NOT disable GPU – keeping hardware acceleration avoids noisy WebGL/SwiftShader logs
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--start-maximized",          # ask Chrome to start maximised
+    # Lower Chromium's own logging verbosity (stderr logging itself is
+    # already off via excludeSwitches=["enable-logging"])
+    "--log-level=3",              # 0=INFO,1=WARNING,2=LOG_ERROR,3=LOG_FATAL
+)
+
+_BASE_EXPERIMENTAL = {
+    # Reduce Chromium console spam and keep automation switches disabled
+    "excludeSwitches": ["enable-automation", "enable-logging"],  # silence "DevTools listening..."
+    "useAutomationExtension": False,
+    # Enable performance logging for CDP event monitoring
+    # This allows my_stealth.cdp_events to capture network and other browser events
+    "perfLoggingPrefs": {"enableNetwork": True, "enablePage": True},
+}
+
+_BASE_CAPS = {
+    "goog:loggingPrefs": {"performance": "ALL", "browser": "ALL"},
+}
+
 # ------------------------------------------------------------------
 # 4️⃣  Public factory – the only thing you import from this module
 # ------------------------------------------------------------------
@@ -323,7 +619,9 @@ def create_stealth_driver(*,
                          driver_path: Optional[str] = None,
                          enable_stealth: bool = True,
                          maximise: bool = True,
-                         apply_viewport: bool = True) -> webdriver.Chrome:
+                         apply_viewport: bool = True,
+                         persistent_stealth: bool = True,
+                         extra_args: Iterable[str] = ()) -> webdriver.Chrome:
     """
     Build a Brave/Chrome driver with the classic UC stealth masks **and**
     an optional persistent profile.
@@ -344,34 +642,27 @@ def create_stealth_driver(*,
     apply_viewport    – if True (default) applies consistent viewport mask
                          for this profile; set to False when you want to keep
                          the browser's natural size (e.g. maximized).
+    persistent_stealth – if True (default) masks are re-applied to every new
+                         document.  False patches only the initial blank
+                         tab, once, via `Runtime.evaluate` (see
+                         `apply_stealth`) – nothing is navigated afterwards,
+                         so every page you load, starting with the first
+                         `driver.get()`, runs WITHOUT the masks.  In effect
+                         False turns stealth off for real pages.
+    extra_args        – additional Chromium command-line switches, appended
+                         after the built-in stealth arguments.
     """
     opts = Options()
-    # Reduce Chromium console spam and keep automation switches disabled
-    opts.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])  # silence "DevTools listening..."
-    opts.add_experimental_option("useAutomationExtension", False)
-    opts.add_argument("--disable-blink-features=AutomationControlled")
-    opts.add_argument("--disable-infobars")
-    opts.add_argument("--disable-extensions")
-    opts.add_argument("--disable-popup-blocking")
-    # Do NOT disable GPU – keeping hardware acceleration avoids noisy WebGL/SwiftShader logs
-    opts.add_argument("--no-sandbox")
-    opts.add_argument("--disable-dev-shm-usage")
-    opts.add_argument("--start-maximized")          # ask Chrome to start maximised
-    # Lower Chromium's own logging verbosity
-    opts.add_argument("--log-level=3")              # 0=INFO,1=WARNING,2=LOG_ERROR,3=LOG_FATAL
-    opts.add_argument("--disable-logging")
+    for arg in _BASE_ARGS:
+        opts.add_argument(arg)
     opts.add_argument(f"user-agent={get_consistent_user_agent()}")
-    
-    # Enable performance logging for CDP event monitoring
-    # This allows my_stealth.cdp_events to capture network and other browser events
-    opts.add_experimental_option("perfLoggingPrefs", {
-        "enableNetwork": True,
-        "enablePage": True
-    })
-    opts.set_capability("goog:loggingPrefs", {
-        "performance": "ALL",
-        "browser": "ALL"
-    })
+    for arg in extra_args:
+        opts.add_argument(arg)
+    for name, value in _BASE_EXPERIMENTAL.items():
+        # Fresh copies so no two drivers share (and could mutate) one object
+        opts.add_experimental_option(name, copy.deepcopy(value))
+    for name, value in _BASE_CAPS.items():
+        opts.set_capability(name, copy.deepcopy(value))
     
     # UC Philosophy: NEVER run headless - it's a major detection flag
     # Real users always have visible browsers, so we do too
@@ -399,18 +690,9 @@ def create_stealth_driver(*,
         if env_path:
             opts.binary_location = env_path
         else:
-            # Auto-detect Brave browser on Windows
-            brave_paths = [
-                r"C:\Program Files\BraveSoftware\Brave-Browser\Application\brave.exe",
-                r"C:\Program Files (x86)\BraveSoftware\Brave-Browser\Application\brave.exe",
-                os.path.expanduser(r"~\AppData\Local\BraveSoftware\Brave-Browser\Application\brave.exe")
-            ]
-            
-            for brave_path in brave_paths:
-                if os.path.exists(brave_path):
-                    opts.binary_location = brave_path
-                    log.info(f"Found Brave browser at: {brave_path}")
-                    break
+            brave_path = _detect_brave_binary()
+            if brave_path:
+                opts.binary_location = brave_path
             else:
                 log.warning("Brave browser not found in standard locations. Will use default Chrome browser.")
                 log.info("To use Brave, set BRAVE_BINARY_PATH environment variable to your Brave executable path.")
@@ -425,7 +707,7 @@ def create_stealth_driver(*,
         # webdriver-manager only when our patcher fails (rare network issues).
 
         try:
-            patched_path = get_patched_chromedriver()
+            patched_path = _patched_chromedriver_path()
             service = Service(patched_path)
             log.info("Using patched ChromeDriver: %s", patched_path)
         except Exception as exc:
@@ -437,45 +719,37 @@ def create_stealth_driver(*,
             else:
                 log.info("No BRAVE_VERSION set – webdriver-manager will auto-detect the browser version")
 
+            # Imported lazily – only this rare fallback path pays for it
+            from webdriver_manager.chrome import ChromeDriverManager
             service = Service(ChromeDriverManager().install())
             log.info("Using *unpatched* driver from webdriver-manager – stealth might be reduced")
 
     driver = webdriver.Chrome(service=service, options=opts)
 
-    # Ensure a stable window before we start injecting CDP scripts.
-    try:
-        driver.get("about:blank")
-    except Exception as exc:   # pragma: no cover
-        log.warning("Initial about:blank navigation failed (non-fatal): %s", exc)
+    # No upfront about:blank navigation – `_add_script` recovers a missing or
+    # unsettled window itself, so the common case saves a full round-trip.
 
     # --------------------------------------------------------------
-    # 5️⃣  **Maximise** – we always have a visible UI for stealth
+    # 5️⃣  **Maximise** – we always have a visible UI for stealth.
+    #     Runs on a worker thread so the window-manager wait overlaps
+    #     with the stealth install below; CDP scripts only affect
+    #     future documents, so the order does not matter.
     # --------------------------------------------------------------
+    maximise_future = None
     if maximise:
-        try:
-            driver.maximize_window()
-            log.info("Browser window maximised via driver.maximize_window()")
-            
-            # Verify window size is valid after maximizing
-            window_size = driver.get_window_size()
-            if window_size['width'] <= 0 or window_size['height'] <= 0:
-                log.warning("Invalid window size after maximize, setting fallback size")
-                driver.set_window_size(1280, 720)
-                
-        except Exception as exc:   # pragma: no cover – safety net
-            log.warning("Failed to maximise window: %s", exc)
-            # Fallback to reasonable size
-            try:
-                driver.set_window_size(1280, 720)
-                log.info("Set fallback window size: 1280x720")
-            except Exception:
-                pass
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="maximise")
+        maximise_future = executor.submit(_maximise_window, driver)
+        executor.shutdown(wait=False)
 
     # --------------------------------------------------------------
     # 6️⃣  Apply stealth masks – consistent fingerprint per profile
     # --------------------------------------------------------------
-    if enable_stealth:
-        apply_stealth(driver, apply_viewport=apply_viewport)
+    try:
+        if enable_stealth:
+            apply_stealth(driver, apply_viewport=apply_viewport, persistent=persistent_stealth)
+    finally:
+        if maximise_future is not None:
+            maximise_future.result()
 
     log.info(
         "Stealth driver created – proxy=%s, profile=%s, maximise=%s, apply_viewport=%s",
@@ -8,11 +8,16 @@ maintain consistent fingerprints to act like a real persistent user.
 import os
 import time
 import platform
+import functools
 from typing import Tuple
 
+# All helpers below are deterministic for a given system/profile, so their
+# results are memoised – call `<func>.cache_clear()` if the system changes.
+
 # ----------------------------------------------------------------------
 # 1️⃣  Consistent User Agent (matches actual browser)
 # ----------------------------------------------------------------------
+@functools.lru_cache(maxsize=1)
 def get_consistent_user_agent() -> str:
     """
     Return a realistic user agent that matches the system and browser.
@@ -57,6 +62,14 @@ def get_consistent_viewport() -> Tuple[int, int, float]:
     
     Returns (width, height, device_pixel_ratio)
     """
+    # Use profile path to ensure same resolution for same profile
+    # This creates a stable "device" fingerprint per profile
+    return _viewport_for_profile(os.getenv("BRAVE_USER_DATA_DIR", "default"))
+
+
+@functools.lru_cache(maxsize=None)
+def _viewport_for_profile(profile_path: str) -> Tuple[int, int, float]:
+    """Cached worker for :func:`get_consistent_viewport`, keyed on profile."""
     # Most common resolutions that match real devices
     # These create believable, consistent fingerprints
     common_resolutions = [
@@ -66,9 +79,6 @@ def get_consistent_viewport() -> Tuple[int, int, float]:
         (1280, 720, 1.0),   # HD (older devices)
     ]
     
-    # Use profile path to ensure same resolution for same profile
-    # This creates a stable "device" fingerprint per profile
-    profile_path = os.getenv("BRAVE_USER_DATA_DIR", "default")
     profile_hash = hash(profile_path)
     resolution_index = abs(profile_hash) % len(common_resolutions)
     
@@ -78,6 +88,7 @@ def get_consistent_viewport() -> Tuple[int, int, float]:
 # ----------------------------------------------------------------------
 # 3️⃣  System timezone (real user's timezone)
 # ----------------------------------------------------------------------
+@functools.lru_cache(maxsize=1)
 def get_system_timezone() -> str:
     """
     Get the actual system timezone using the most reliable method.
@@ -119,6 +130,7 @@ def get_system_timezone() -> str:
         return "UTC"
 
 
+@functools.lru_cache(maxsize=1)
 def get_system_timezone_offset() -> int:
     """
     Get actual system timezone offset in minutes.
@@ -136,6 +148,7 @@ def get_system_timezone_offset() -> int:
 # ----------------------------------------------------------------------
 # 4️⃣  Consistent hardware specs (match system or realistic preset)
 # ----------------------------------------------------------------------
+@functools.lru_cache(maxsize=1)
 def get_consistent_hardware() -> Tuple[int, int]:
     """
     Return consistent hardware specs (CPU cores, RAM GB).
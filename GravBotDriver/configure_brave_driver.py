@@ -30,22 +30,150 @@ Environment Variables (optional):
 """
 
 import os
+import re
+import json
 import logging
 import platform
+import shutil
+import threading
+import functools
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
-from selenium.webdriver.chrome.webdriver import WebDriver
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import urlsplit
 
-# Import our stealth package
-import Auferstehung as uc
+# selenium and the stealth package are imported lazily inside the driver
+# factories, so path-detection helpers stay cheap to import.
+if TYPE_CHECKING:
+    from selenium.webdriver.chrome.webdriver import WebDriver
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)-8s %(message)s",
-    datefmt="%H:%M:%S",
-)
+# Library logger – handlers/levels are left to the host application
 log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+# ---------------------------------------------------------------------------
+# Platform-specific locations – expanded once at import, not per call
+# ---------------------------------------------------------------------------
+_SYSTEM = platform.system()
+_HOME = os.path.expanduser("~")  # resolved once (registry/pwd lookup)
+
+
+def _expand_home(path: str) -> str:
+    """`os.path.expanduser` with the current user's home taken from `_HOME`."""
+    if path == "~" or path.startswith(("~/", "~" + os.sep)):
+        return _HOME + path[1:]
+    if path.startswith("~"):
+        return os.path.expanduser(path)  # ~otheruser/…
+    return path
+
+
+if _SYSTEM == "Windows":
+    # Windows paths in order of likelihood
+    _BRAVE_CANDIDATES = (
+        # User installation (most common)
+        _HOME + r"\AppData\Local\BraveSoftware\Brave-Browser\Application\brave.exe",
+        # System-wide installations
+        r"C:\Program Files\BraveSoftware\Brave-Browser\Application\brave.exe",
+        r"C:\Program Files (x86)\BraveSoftware\Brave-Browser\Application\brave.exe",
+        # Using environment variables for robustness
+        os.path.expandvars(r"%LocalAppData%\BraveSoftware\Brave-Browser\Application\brave.exe"),
+        os.path.expandvars(r"%ProgramFiles%\BraveSoftware\Brave-Browser\Application\brave.exe"),
+        os.path.expandvars(r"%ProgramFiles(x86)%\BraveSoftware\Brave-Browser\Application\brave.exe"),
+    )
+    _DEFAULT_DATA_DIR = _HOME + r"\AppData\Local\BraveSoftware\Brave-Browser\User Data"
+    _BRAVE_PATH_NAMES = ()  # installer never puts Brave on PATH
+elif _SYSTEM == "Darwin":  # macOS
+    _BRAVE_CANDIDATES = (
+        "/Applications/Brave Browser.app/Contents/MacOS/Brave Browser",
+        _HOME + "/Applications/Brave Browser.app/Contents/MacOS/Brave Browser",
+    )
+    _DEFAULT_DATA_DIR = _HOME + "/Library/Application Support/BraveSoftware/Brave-Browser"
+    _BRAVE_PATH_NAMES = ()  # app bundle, never on PATH
+else:  # Linux and other Unix-like systems
+    _BRAVE_CANDIDATES = (
+        "/usr/bin/brave-browser",
+        "/usr/bin/brave",
+        "/opt/brave.com/brave/brave-browser",
+        "/snap/brave/current/usr/bin/brave",  # Snap package
+        "/var/lib/flatpak/exports/bin/com.brave.Browser",  # Flatpak
+        _HOME + "/.local/bin/brave-browser",  # User local install
+    )
+    _DEFAULT_DATA_DIR = _HOME + "/.config/BraveSoftware/Brave-Browser"
+    # Resolved via PATH before the fixed locations (AUR, nix, custom prefixes)
+    _BRAVE_PATH_NAMES = ("brave-browser", "brave", "brave-browser-stable")
+
+# %ProgramFiles% etc. usually expand to the literal paths above – drop the
+# duplicates (order preserved) and any variable that failed to expand
+_BRAVE_CANDIDATES = tuple(dict.fromkeys(
+    os.path.normpath(p) for p in _BRAVE_CANDIDATES if "%" not in p
+))
+
+
+def _list_dir(parent: str) -> dict:
+    """Map normcased entry names of *parent* to their DirEntry (empty if unreadable)."""
+    try:
+        with os.scandir(parent) as entries:
+            return {os.path.normcase(e.name): e for e in entries}
+    except OSError:
+        return {}
+
+
+def _is_executable(path: str, entry: Optional[os.DirEntry] = None) -> bool:
+    """
+    True if *path* is a regular file we can launch.  POSIX checks the exec
+    bit; on Windows X_OK is meaningless, so existence as a file suffices.
+    *entry* (from `os.scandir`) answers the file check without a stat.
+    """
+    try:
+        is_file = entry.is_file() if entry is not None else os.path.isfile(path)
+    except OSError:
+        return False
+    return is_file and (_SYSTEM == "Windows" or os.access(path, os.X_OK))
+
+
+def _first_existing(paths) -> Optional[str]:
+    """
+    Return the first entry of *paths* that is an executable file, or None.
+
+    Each parent directory is listed once with `os.scandir` and basenames are
+    matched in memory instead of stat-ing every full candidate path.  When
+    several parents are involved (Windows: Program Files, LocalAppData …)
+    the listings run concurrently so a cold disk costs the slowest single
+    listing rather than the sum; single-core hosts list serially.
+    """
+    paths = list(paths)
+    parents = list(dict.fromkeys(os.path.dirname(p) for p in paths))
+
+    if len(parents) > 1 and (os.cpu_count() or 1) > 1:
+        with ThreadPoolExecutor(max_workers=len(parents)) as pool:
+            listings = dict(zip(parents, pool.map(_list_dir, parents)))
+    else:
+        listings = {parent: _list_dir(parent) for parent in parents}
+
+    # Priority order preserved – first launchable candidate wins
+    for path in paths:
+        parent, name = os.path.split(path)
+        entry = listings[parent].get(os.path.normcase(name))
+        if entry is not None and _is_executable(path, entry):
+            return path
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def load_dotenv_once() -> None:
+    """
+    Load `.env` from the CWD or the project root, at most once per process.
+
+    The stealth package does the same when it is imported, but that import is
+    deferred to `create_brave_driver`; the path/profile helpers below call
+    this first so BRAVE_* values from `.env` are seen (and cached) by them too.
+    """
+    for candidate in (Path.cwd() / ".env", Path(__file__).resolve().parent.parent / ".env"):
+        if candidate.is_file():
+            from dotenv import load_dotenv
+            load_dotenv(candidate)
+            return
 
 
 def find_brave_browser() -> Optional[str]:
@@ -54,84 +182,183 @@ def find_brave_browser() -> Optional[str]:
     
     Returns the path to Brave executable if found, None otherwise.
     Prioritizes environment variable override, then checks standard locations.
+
+    The result is cached per BRAVE_BINARY_PATH value – the binary does not
+    move during a process lifetime.  Call `find_brave_browser.cache_clear()`
+    to force a fresh probe.
     """
+    load_dotenv_once()
+    return _probe_brave_browser(os.getenv("BRAVE_BINARY_PATH", ""))
+
+
+@functools.lru_cache(maxsize=8)
+def _probe_brave_browser(env_path: str) -> Optional[str]:
+    """Probe worker for :func:`find_brave_browser`, memoised per env value."""
     # Check environment variable first (allows user override)
-    env_path = os.getenv("BRAVE_BINARY_PATH")
-    if env_path and os.path.exists(env_path):
+    if env_path and _is_executable(env_path):
         log.info(f"Using Brave from environment variable: {env_path}")
         return env_path
     
-    system = platform.system()
-    
-    if system == "Windows":
-        # Windows paths in order of likelihood
-        possible_paths = [
-            # User installation (most common)
-            os.path.expanduser(r"~\AppData\Local\BraveSoftware\Brave-Browser\Application\brave.exe"),
-            # System-wide installations
-            r"C:\Program Files\BraveSoftware\Brave-Browser\Application\brave.exe",
-            r"C:\Program Files (x86)\BraveSoftware\Brave-Browser\Application\brave.exe",
-            # Using environment variables for robustness
-            os.path.expandvars(r"%LocalAppData%\BraveSoftware\Brave-Browser\Application\brave.exe"),
-            os.path.expandvars(r"%ProgramFiles%\BraveSoftware\Brave-Browser\Application\brave.exe"),
-            os.path.expandvars(r"%ProgramFiles(x86)%\BraveSoftware\Brave-Browser\Application\brave.exe"),
-        ]
-    elif system == "Darwin":  # macOS
-        possible_paths = [
-            "/Applications/Brave Browser.app/Contents/MacOS/Brave Browser",
-            os.path.expanduser("~/Applications/Brave Browser.app/Contents/MacOS/Brave Browser"),
-        ]
-    else:  # Linux and other Unix-like systems
-        possible_paths = [
-            "/usr/bin/brave-browser",
-            "/usr/bin/brave",
-            "/opt/brave.com/brave/brave-browser",
-            "/snap/brave/current/usr/bin/brave",  # Snap package
-            "/var/lib/flatpak/exports/bin/com.brave.Browser",  # Flatpak
-            os.path.expanduser("~/.local/bin/brave-browser"),  # User local install
-        ]
-    
-    # Check each path
-    for path in possible_paths:
-        if os.path.exists(path):
-            log.info(f"Found Brave browser at: {path}")
+    # Linux: anything on PATH (distro packages, AUR, nix, custom prefixes)
+    for name in _BRAVE_PATH_NAMES:
+        path = shutil.which(name)
+        if path:
+            log.info(f"Found Brave browser on PATH: {path}")
             return path
     
+    # Check each path (priority order preserved)
+    path = _first_existing(_BRAVE_CANDIDATES)
+    if path:
+        log.info(f"Found Brave browser at: {path}")
+        return path
+    
     log.warning("Brave browser not found at any standard location")
     log.info("Tip: Set BRAVE_BINARY_PATH environment variable to specify custom Brave location")
     return None
 
 
+find_brave_browser.cache_clear = _probe_brave_browser.cache_clear
+
+
 def get_profile_config() -> tuple[str, str]:
     """
     Get Brave profile configuration from environment or sensible defaults.
     
     Returns (user_data_dir, profile_name) tuple.
     """
+    load_dotenv_once()
     # Check environment variables first
     user_data_dir = os.getenv("BRAVE_USER_DATA_DIR")
     profile_name = os.getenv("BRAVE_PROFILE_NAME", "Default")
     
     if user_data_dir:
         # Expand user path if needed
-        user_data_dir = os.path.expanduser(user_data_dir)
-        log.info(f"Using Brave profile from environment: {user_data_dir}/{profile_name}")
+        user_data_dir = _expand_home(user_data_dir)
+        if log.isEnabledFor(logging.INFO):
+            log.info(f"Using Brave profile from environment: {user_data_dir}/{profile_name}")
         return user_data_dir, profile_name
     
-    # Determine default Brave profile location by platform
-    system = platform.system()
-    
-    if system == "Windows":
-        default_data_dir = os.path.expanduser(r"~\AppData\Local\BraveSoftware\Brave-Browser\User Data")
-    elif system == "Darwin":  # macOS
-        default_data_dir = os.path.expanduser("~/Library/Application Support/BraveSoftware/Brave-Browser")
-    else:  # Linux
-        default_data_dir = os.path.expanduser("~/.config/BraveSoftware/Brave-Browser")
-    
-    log.info(f"Using default Brave profile: {default_data_dir}/{profile_name}")
+    default_data_dir = _DEFAULT_DATA_DIR
+    if log.isEnabledFor(logging.INFO):
+        log.info(f"Using default Brave profile: {default_data_dir}/{profile_name}")
     return default_data_dir, profile_name
 
 
+@dataclass(frozen=True)
+class BraveConfig:
+    """
+    Resolved Brave binary + profile location, built once by `detect()`.
+
+    Immutable, so a single detected instance can be shared by every
+    `create_brave_driver*` call; pass one explicitly via ``config=`` to pin
+    a different binary or profile.
+    """
+    __slots__ = ("binary_path", "user_data_dir", "profile_name")
+
+    binary_path: Optional[str]
+    user_data_dir: str
+    profile_name: str
+
+    @classmethod
+    def detect(cls) -> "BraveConfig":
+        """Detect from environment/defaults; cached per BRAVE_* env values."""
+        load_dotenv_once()
+        return _detect_brave_config(
+            os.getenv("BRAVE_BINARY_PATH", ""),
+            os.getenv("BRAVE_USER_DATA_DIR", ""),
+            os.getenv("BRAVE_PROFILE_NAME", ""),
+        )
+
+
+@functools.lru_cache(maxsize=8)
+def _detect_brave_config(binary_env: str, data_env: str, profile_env: str) -> BraveConfig:
+    """Worker for :meth:`BraveConfig.detect`; arguments only key the cache."""
+    user_data_dir, profile_name = get_profile_config()
+    return BraveConfig(find_brave_browser(), user_data_dir, profile_name)
+
+
+def _norm_dir(path: str) -> str:
+    """Absolute, case-normalised form of *path* for directory comparisons."""
+    return os.path.normcase(os.path.abspath(_expand_home(path)))
+
+
+def is_real_brave_profile(user_data_dir: str) -> bool:
+    """
+    True if *user_data_dir* is the user's own Brave data dir – the platform
+    default or the one detected from BRAVE_USER_DATA_DIR – rather than a
+    throwaway/automation profile passed in via ``profile_path``.
+    """
+    target = _norm_dir(user_data_dir)
+    return target in (_norm_dir(_DEFAULT_DATA_DIR), _norm_dir(BraveConfig.detect().user_data_dir))
+
+
+def _seed_profile(user_data_dir: str, profile_dir_name: str) -> None:
+    """
+    Pre-seed a brand-new profile so Brave's first launch skips the first-run
+    flow and the "didn't shut down correctly" recovery path.
+
+    Writes a minimal Preferences (exit_type matches what
+    `Auferstehung.driver_factory._fix_exit_type` expects, so it is not
+    rewritten again), the "First Run" sentinel and the GPU/shader cache
+    directories.  Anything that already exists is left untouched.
+    """
+    profile_dir = Path(user_data_dir, profile_dir_name)
+    prefs_file = profile_dir / "Preferences"
+    try:
+        if not prefs_file.exists():
+            profile_dir.mkdir(parents=True, exist_ok=True)
+            prefs_file.write_text(
+                json.dumps({"profile": {"exit_type": "CleanExit", "exited_cleanly": True}}),
+                encoding="utf-8",
+            )
+            log.debug(f"Seeded fresh profile preferences: {prefs_file}")
+
+        first_run = Path(user_data_dir, "First Run")
+        if not first_run.exists():
+            first_run.touch()
+
+        for cache_dir in (profile_dir / "GPUCache", Path(user_data_dir, "ShaderCache")):
+            cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        log.warning(f"Could not pre-seed profile (non-fatal): {e}")
+
+
+# Disk HTTP cache kept inside the persistent profile
+_DISK_CACHE_SIZE = 500 * 1024 * 1024  # bytes
+_CACHE_DEFEATING_ARGS = ("--disable-application-cache", "--incognito", "--disk-cache-dir", "--disk-cache-size")
+
+
+# All stealth checks in one expression, evaluated on a fresh about:blank
+_STEALTH_STATUS_JS = (
+    "({webdriver_hidden: navigator.webdriver === undefined,"
+    " plugins: navigator.plugins.length,"
+    " languages: navigator.languages.length})"
+)
+
+
+def _stealth_status(driver: "WebDriver") -> dict:
+    """
+    Evaluate the stealth checks in a single CDP `Runtime.evaluate` round-trip.
+    Falls back to one `execute_script` when the CDP call is unavailable or
+    fails.
+
+    The initial document predates the masks (they are installed with
+    `Page.addScriptToEvaluateOnNewDocument`, and the factory no longer
+    navigates after that), so a new about:blank document is loaded first –
+    probing the initial one would always report the masks as missing.
+    """
+    driver.get("about:blank")
+    try:
+        result = driver.execute_cdp_cmd(
+            "Runtime.evaluate",
+            {"expression": _STEALTH_STATUS_JS, "returnByValue": True, "awaitPromise": False},
+        )
+        return result["result"]["value"]
+    except Exception as e:
+        log.debug(f"Runtime.evaluate unavailable for stealth check, using execute_script: {e}")
+        return driver.execute_script(f"return {_STEALTH_STATUS_JS};")
+
+
 def create_brave_driver(
     *,
     headless: bool = False,
@@ -139,8 +366,9 @@ def create_brave_driver(
     profile_name: Optional[str] = None,
     maximize: bool = True,
     enable_stealth: bool = True,
+    config: Optional[BraveConfig] = None,
     **kwargs
-) -> WebDriver:
+) -> "WebDriver":
     """
     Create a stealth Brave WebDriver instance with automatic configuration.
     
@@ -162,8 +390,16 @@ def create_brave_driver(
         Maximize browser window on startup
     enable_stealth : bool, default True
         Enable stealth patches (disable for debugging)
+    config : BraveConfig, optional
+        Pre-resolved binary/profile; defaults to `BraveConfig.detect()`.
+        An explicit ``profile_path`` still overrides its profile fields.
     **kwargs
-        Additional arguments passed to create_stealth_driver
+        Additional arguments passed to create_stealth_driver.  A persistent
+        disk cache (``<user_data_dir>/HTTPCache``) is always added to
+        ``extra_args``; ``--incognito`` / ``--disable-application-cache``
+        are dropped.
+        ``prewarm_url=<url>`` preconnects to that URL's origin right after
+        creation (see `prewarm_for`).
     
     Returns
     -------
@@ -192,11 +428,16 @@ def create_brave_driver(
     Headless mode:
     >>> driver = create_brave_driver(headless=True)
     """
+    # Import our stealth package
+    import Auferstehung as uc
+
     try:
         log.info("🚀 Configuring Brave WebDriver with my_stealth...")
         
         # Find Brave browser executable
-        brave_path = find_brave_browser()
+        if config is None:
+            config = BraveConfig.detect()
+        brave_path = config.binary_path
         if not brave_path:
             error_msg = (
                 "CRITICAL ERROR: Brave browser not found!\n"
@@ -209,18 +450,35 @@ def create_brave_driver(
         # Configure profile settings
         if profile_path:
             # Use custom profile path
-            user_data_dir = os.path.expanduser(profile_path)
+            user_data_dir = _expand_home(profile_path)
             profile_dir_name = profile_name or "Default"
-            log.info(f"Using custom profile: {user_data_dir}/{profile_dir_name}")
+            if log.isEnabledFor(logging.INFO):
+                log.info(f"Using custom profile: {user_data_dir}/{profile_dir_name}")
         else:
             # Use environment or default profile configuration
-            user_data_dir, profile_dir_name = get_profile_config()
+            user_data_dir, profile_dir_name = config.user_data_dir, config.profile_name
         
-        # Ensure profile directory exists
-        Path(user_data_dir).mkdir(parents=True, exist_ok=True)
+        # Pre-seed automation-owned profiles on first use – the user's real
+        # profile is never touched.  No separate mkdir: seeding and the cache
+        # dir below create the directory, and the factory ensures it anyway.
+        if not is_real_brave_profile(user_data_dir):
+            _seed_profile(user_data_dir, profile_dir_name)
+        
+        # Persistent HTTP cache inside the profile so revisited domains load
+        # JS/CSS/images from disk; drop caller flags that would defeat it
+        cache_dir = os.path.join(user_data_dir, "HTTPCache")
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir, exist_ok=True)
+        extra_args = [
+            arg for arg in kwargs.pop("extra_args", ())
+            if not arg.startswith(_CACHE_DEFEATING_ARGS)
+        ]
+        extra_args += [f"--disk-cache-dir={cache_dir}", f"--disk-cache-size={_DISK_CACHE_SIZE}"]
+        prewarm_url = kwargs.pop("prewarm_url", None)
         
         # Create stealth driver with our configuration
         driver = uc.create_driver(
+            extra_args=extra_args,
             headless=headless,
             profile_path=user_data_dir,
             profile_name=profile_dir_name,
@@ -232,12 +490,21 @@ def create_brave_driver(
         
         log.info("✅ Brave WebDriver configured successfully!")
         
-        # Verify stealth is working
-        if enable_stealth:
+        # Start DNS + TCP/TLS for the first target while the caller sets up
+        if prewarm_url:
+            prewarm_for(driver, prewarm_url)
+        
+        # Verify stealth is working – one fused probe on a fresh document the
+        # new-document masks have run in.  One-shot masks
+        # (persistent_stealth=False) only patched the initial page and would
+        # be gone after that navigation, so there is nothing to verify then.
+        if enable_stealth and not kwargs.get("persistent_stealth", True):
+            log.info("Stealth status not verified: one-shot masks do not survive navigation")
+        elif enable_stealth:
             try:
-                driver.get("about:blank")
-                webdriver_hidden = driver.execute_script("return navigator.webdriver === undefined;")
-                log.info(f"Stealth status: navigator.webdriver hidden = {webdriver_hidden}")
+                status = _stealth_status(driver)
+                log.info(f"Stealth status: navigator.webdriver hidden = {status['webdriver_hidden']} "
+                         f"(plugins={status['plugins']}, languages={status['languages']})")
             except Exception as e:
                 log.warning(f"Could not verify stealth status: {e}")
         
@@ -248,12 +515,49 @@ def create_brave_driver(
         raise
 
 
+def prewarm_for(driver: "WebDriver", url: str) -> None:
+    """
+    Ask the browser to pre-resolve DNS and pre-open a connection to *url*'s
+    origin, so the handshake overlaps with whatever the caller does before
+    `driver.get(url)`.  Failures are logged and ignored.
+    """
+    parts = urlsplit(url)
+    if not (parts.scheme and parts.netloc):
+        log.warning(f"prewarm_for: not an absolute URL, skipping: {url}")
+        return
+    origin = f"{parts.scheme}://{parts.netloc}"
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_script(
+            "const root = document.head || document.documentElement;"
+            "for (const rel of ['dns-prefetch', 'preconnect']) {"
+            "  const l = document.createElement('link');"
+            "  l.rel = rel; l.href = arguments[0]; l.crossOrigin = 'anonymous';"
+            "  root.appendChild(l);"
+            "}",
+            origin,
+        )
+        log.debug(f"Prewarmed connection to {origin}")
+    except Exception as e:
+        log.warning(f"Could not prewarm {origin} (non-fatal): {e}")
+
+
+# UC arguments that my_stealth handles itself (logged, then ignored)
+_IGNORED_RE = re.compile(
+    r"--(?:disable-blink-features=AutomationControlled"  # We handle this
+    r"|disable-infobars"  # We handle this
+    r"|user-data-dir"  # We handle this via profile_path
+    r"|profile-directory)"  # We handle this via profile_name
+)
+_HEADLESS_RE = re.compile(r"--headless")
+
+
 def create_brave_driver_uc_compatible(
     options=None,
     use_subprocess=True,
     version_main=None,
     **kwargs
-) -> WebDriver:
+) -> "WebDriver":
     """
     UC-compatible interface for easy migration from undetected-chromedriver.
     
@@ -291,15 +595,13 @@ def create_brave_driver_uc_compatible(
     headless = False
     if options:
         args = getattr(options, '_arguments', [])
-        headless = any('--headless' in arg for arg in args)
-        
-        # Log ignored UC-specific arguments for awareness
-        ignored_args = [arg for arg in args if any(pattern in arg for pattern in [
-            '--disable-blink-features=AutomationControlled',  # We handle this
-            '--disable-infobars',  # We handle this
-            '--user-data-dir',  # We handle this via profile_path
-            '--profile-directory'  # We handle this via profile_name
-        ])]
+        # Single pass over the args with precompiled patterns
+        ignored_args = []
+        for arg in args:
+            if _HEADLESS_RE.search(arg):
+                headless = True
+            if _IGNORED_RE.search(arg):
+                ignored_args.append(arg)
         if ignored_args:
             log.info(f"Note: Some UC options are auto-handled by my_stealth: {ignored_args}")
     
@@ -311,13 +613,152 @@ def create_brave_driver_uc_compatible(
     )
 
 
+# ---------------------------------------------------------------------------
+# Driver pool – reuse one live browser per profile instead of relaunching
+# ---------------------------------------------------------------------------
+# A Chromium user-data-dir can only be held by one browser process at a
+# time, so the pool keeps at most one driver per (user_data_dir, profile,
+# headless) key.  A driver is checked out to one caller at a time; other
+# callers for the same key wait for it to be released.
+_driver_cache: dict = {}
+_driver_cache_cond = threading.Condition()
+_driver_launching: set = set()   # keys whose driver is being launched
+
+
+def get_or_create_brave_driver(
+    *,
+    headless: bool = False,
+    profile_path: Optional[str] = None,
+    profile_name: Optional[str] = None,
+    wait_timeout: float = 60.0,
+    **kwargs
+) -> "WebDriver":
+    """
+    Check out the pooled, live Brave driver for the profile – launching one
+    only when the pool has none (or the cached one has died).
+
+    The driver belongs to the caller until it is handed back with
+    `release_brave_driver()` (instead of `quit()`); meanwhile other callers
+    for the same profile block for up to *wait_timeout* seconds and then get
+    a TimeoutError – a second browser cannot open the same profile anyway.
+    Call `close_brave_driver_pool()` once at the end of the run.
+    Remaining keyword arguments are only used when a new driver is launched.
+    """
+    if profile_path:
+        user_data_dir = _expand_home(profile_path)
+        profile_dir_name = profile_name or "Default"
+    else:
+        config = kwargs.get("config") or BraveConfig.detect()
+        user_data_dir, profile_dir_name = config.user_data_dir, config.profile_name
+    key = (user_data_dir, profile_dir_name, headless)
+
+    with _driver_cache_cond:
+        if not _driver_cache_cond.wait_for(
+            lambda: key not in _driver_launching
+            and not getattr(_driver_cache.get(key), "_brave_checked_out", False),
+            timeout=wait_timeout,
+        ):
+            raise TimeoutError(
+                f"Pooled Brave driver for {user_data_dir}/{profile_dir_name} "
+                f"still checked out after {wait_timeout}s"
+            )
+        # Claim the key – check the cached driver out, or reserve a launch –
+        # so the liveness probe and the (slow) launch run without the lock
+        driver = _driver_cache.get(key)
+        if driver is not None:
+            driver._brave_checked_out = True
+        else:
+            _driver_launching.add(key)
+
+    if driver is not None:
+        try:
+            driver.current_window_handle  # cheap liveness probe
+            log.info("♻️ Reusing pooled Brave driver for %s/%s", user_data_dir, profile_dir_name)
+            return driver
+        except Exception as e:
+            log.warning(f"Pooled driver is no longer alive, relaunching: {e}")
+        # Quit it so an orphaned browser/chromedriver does not keep holding
+        # the profile's SingletonLock and break the relaunch below
+        try:
+            driver.quit()
+        except Exception as e:
+            log.debug(f"Error quitting dead pooled driver: {e}")
+        with _driver_cache_cond:
+            if _driver_cache.get(key) is driver:
+                del _driver_cache[key]
+            _driver_launching.add(key)
+
+    driver = None
+    try:
+        driver = create_brave_driver(
+            headless=headless,
+            profile_path=user_data_dir,
+            profile_name=profile_dir_name,
+            **kwargs
+        )
+        driver._brave_pool_key = key
+        driver._brave_checked_out = True
+        return driver
+    finally:
+        with _driver_cache_cond:
+            _driver_launching.discard(key)
+            if driver is not None:
+                _driver_cache[key] = driver
+            _driver_cache_cond.notify_all()
+
+
+def _is_detected_real_profile(driver: "WebDriver") -> bool:
+    """True if *driver* runs on the user's real Brave profile (see `is_real_brave_profile`)."""
+    key = getattr(driver, "_brave_pool_key", None)
+    return key is not None and is_real_brave_profile(key[0])
+
+
+def release_brave_driver(driver: "WebDriver", *, clear_cookies: Optional[bool] = None) -> None:
+    """
+    Reset a checked-out driver and hand it back to the pool instead of
+    quitting it.
+
+    Web storage of the current origin is cleared first (it cannot be reached
+    once on about:blank), then cookies, and finally the tab is parked on
+    about:blank.  *clear_cookies* defaults to True – except on the detected
+    real Brave profile, whose site data (storage and cookies) is left alone
+    unless `clear_cookies=True` is passed explicitly.
+    """
+    if clear_cookies is None:
+        clear_cookies = not _is_detected_real_profile(driver)
+    try:
+        if clear_cookies:
+            try:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except Exception as e:
+                log.debug(f"Could not clear web storage on release: {e}")
+            driver.delete_all_cookies()
+        driver.get("about:blank")
+    finally:
+        with _driver_cache_cond:
+            driver._brave_checked_out = False
+            _driver_cache_cond.notify_all()
+
+
+def close_brave_driver_pool() -> None:
+    """Quit every pooled driver (call once at the end of a test run)."""
+    with _driver_cache_cond:
+        while _driver_cache:
+            _, driver = _driver_cache.popitem()
+            try:
+                driver.quit()
+            except Exception as e:
+                log.debug(f"Error quitting pooled driver: {e}")
+        _driver_cache_cond.notify_all()
+
+
 # Convenience aliases for different use cases
-def get_brave_driver(**kwargs) -> WebDriver:
+def get_brave_driver(**kwargs) -> "WebDriver":
     """Alias for create_brave_driver - matches naming from test files."""
     return create_brave_driver(**kwargs)
 
 
-def configure_chrome_driver(**kwargs) -> WebDriver:
+def configure_chrome_driver(**kwargs) -> "WebDriver":
     """
     Drop-in replacement for the original configure_chrome_driver function.
     Now uses my_stealth instead of UC with much simpler configuration.
@@ -330,7 +771,16 @@ if __name__ == "__main__":
     """
     Example usage demonstrating the driver configuration.
     """
-    import time
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+    
+    # Standalone run – show the INFO progress lines on the console
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)-8s %(message)s",
+        datefmt="%H:%M:%S",
+    )
     
     log.info("🧪 Testing Brave driver configuration...")
     
@@ -341,7 +791,7 @@ if __name__ == "__main__":
         # Quick functionality test
         log.info("Testing basic navigation...")
         driver.get("https://www.google.com")
-        time.sleep(2)
+        WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.NAME, "q")))
         
         # Verify stealth
         webdriver_status = driver.execute_script("return navigator.webdriver;")
@@ -349,10 +799,12 @@ if __name__ == "__main__":
         
         # Test search functionality
         try:
-            search_box = driver.find_element("name", "q")
+            search_box = driver.find_element(By.NAME, "q")
             search_box.send_keys("my_stealth package test")
             search_box.submit()
-            time.sleep(3)
+            # Results page replaced the old document and has rendered its body
+            WebDriverWait(driver, 10).until(EC.staleness_of(search_box))
+            WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
             log.info("✅ Basic functionality test passed!")
         except Exception as e:
             log.warning(f"Search test failed (non-critical): {e}")
@@ -1,25 +1,32 @@
 import os
+import re
+import sys
 import time
 import logging
-import re
-from selenium.webdriver.chrome.service import Service
+import functools
+import threading
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
 from game.core import GamePhase
 from configs.sites import SITE_CONFIGS
 from utils.js_monitor import check_session_expired_flag
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    NoSuchWindowException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
 from database.session_state import session_state
+from configure_brave_driver import is_real_brave_profile, load_dotenv_once
 
-import platform
-from pathlib import Path
-from typing import Optional
-from selenium.webdriver.chrome.webdriver import WebDriver
+from typing import TYPE_CHECKING, Optional
 
-# Import our stealth package
-import Auferstehung as uc
+# Driver-construction-only imports (platform, pathlib, the stealth package)
+# live inside the functions that need them, to keep module import cheap.
+if TYPE_CHECKING:
+    from selenium.webdriver.chrome.webdriver import WebDriver
 
 # Configure logging
 logging.basicConfig(
@@ -29,13 +36,6 @@ logging.basicConfig(
 )
 log = logging.getLogger(__name__)
 
-# Windows registry import for version detection
-if os.name == 'nt':
-    try:
-        import winreg
-    except ImportError:
-        winreg = None
-
 """
 The _high5_last_phase variable has an interesting history in this codebase:
 
@@ -58,51 +58,62 @@ ongoing state management.
 # Global variable only used for initial state tracking in setup.py
 _high5_last_phase = None
 
+# Standard Brave locations for this platform, expanded and de-duplicated once
+# at import (%LocalAppData%/%ProgramFiles% usually resolve to the literal paths)
+if os.name == 'nt':
+    # Windows paths in order of likelihood
+    _BRAVE_PATHS = tuple(dict.fromkeys([
+        # User installation (most common)
+        os.path.expanduser(r"~\AppData\Local\BraveSoftware\Brave-Browser\Application\brave.exe"),
+        # System-wide installations
+        r"C:\Program Files\BraveSoftware\Brave-Browser\Application\brave.exe",
+        r"C:\Program Files (x86)\BraveSoftware\Brave-Browser\Application\brave.exe",
+        # Using environment variables for robustness
+        os.path.expandvars(r"%LocalAppData%\BraveSoftware\Brave-Browser\Application\brave.exe"),
+        os.path.expandvars(r"%ProgramFiles%\BraveSoftware\Brave-Browser\Application\brave.exe"),
+        os.path.expandvars(r"%ProgramFiles(x86)%\BraveSoftware\Brave-Browser\Application\brave.exe"),
+    ]))
+elif sys.platform == 'darwin':  # macOS
+    _BRAVE_PATHS = (
+        "/Applications/Brave Browser.app/Contents/MacOS/Brave Browser",
+        os.path.expanduser("~/Applications/Brave Browser.app/Contents/MacOS/Brave Browser"),
+    )
+else:  # Linux and other Unix-like systems
+    _BRAVE_PATHS = (
+        "/usr/bin/brave-browser",
+        "/usr/bin/brave",
+        "/opt/brave.com/brave/brave-browser",
+        "/snap/brave/current/usr/bin/brave",  # Snap package
+        "/var/lib/flatpak/exports/bin/com.brave.Browser",  # Flatpak
+        os.path.expanduser("~/.local/bin/brave-browser"),  # User local install
+    )
+
+
 def find_brave_browser() -> Optional[str]:
     """
     Cross-platform Brave browser detection with comprehensive fallbacks.
     
     Returns the path to Brave executable if found, None otherwise.
     Prioritizes environment variable override, then checks standard locations.
+
+    The result is cached per BRAVE_BINARY_PATH value – the binary does not
+    move during a process lifetime.  Call `find_brave_browser.cache_clear()`
+    to force a fresh probe.
     """
+    load_dotenv_once()
+    return _probe_brave_browser(os.getenv("BRAVE_BINARY_PATH", ""))
+
+
+@functools.lru_cache(maxsize=8)
+def _probe_brave_browser(env_path: str) -> Optional[str]:
+    """Probe worker for :func:`find_brave_browser`, memoised per env value."""
     # Check environment variable first (allows user override)
-    env_path = os.getenv("BRAVE_BINARY_PATH")
     if env_path and os.path.exists(env_path):
         log.info(f"Using Brave from environment variable: {env_path}")
         return env_path
     
-    system = platform.system()
-    
-    if system == "Windows":
-        # Windows paths in order of likelihood
-        possible_paths = [
-            # User installation (most common)
-            os.path.expanduser(r"~\AppData\Local\BraveSoftware\Brave-Browser\Application\brave.exe"),
-            # System-wide installations
-            r"C:\Program Files\BraveSoftware\Brave-Browser\Application\brave.exe",
-            r"C:\Program Files (x86)\BraveSoftware\Brave-Browser\Application\brave.exe",
-            # Using environment variables for robustness
-            os.path.expandvars(r"%LocalAppData%\BraveSoftware\Brave-Browser\Application\brave.exe"),
-            os.path.expandvars(r"%ProgramFiles%\BraveSoftware\Brave-Browser\Application\brave.exe"),
-            os.path.expandvars(r"%ProgramFiles(x86)%\BraveSoftware\Brave-Browser\Application\brave.exe"),
-        ]
-    elif system == "Darwin":  # macOS
-        possible_paths = [
-            "/Applications/Brave Browser.app/Contents/MacOS/Brave Browser",
-            os.path.expanduser("~/Applications/Brave Browser.app/Contents/MacOS/Brave Browser"),
-        ]
-    else:  # Linux and other Unix-like systems
-        possible_paths = [
-            "/usr/bin/brave-browser",
-            "/usr/bin/brave",
-            "/opt/brave.com/brave/brave-browser",
-            "/snap/brave/current/usr/bin/brave",  # Snap package
-            "/var/lib/flatpak/exports/bin/com.brave.Browser",  # Flatpak
-            os.path.expanduser("~/.local/bin/brave-browser"),  # User local install
-        ]
-    
     # Check each path
-    for path in possible_paths:
+    for path in _BRAVE_PATHS:
         if os.path.exists(path):
             log.info(f"Found Brave browser at: {path}")
             return path
@@ -112,16 +123,28 @@ def find_brave_browser() -> Optional[str]:
     return None
 
 
+find_brave_browser.cache_clear = _probe_brave_browser.cache_clear
+
+
 def get_profile_config() -> tuple[str, str]:
     """
     Get Brave profile configuration from environment or sensible defaults.
     
-    Returns (user_data_dir, profile_name) tuple.
+    Returns (user_data_dir, profile_name) tuple, cached per
+    BRAVE_USER_DATA_DIR / BRAVE_PROFILE_NAME values
+    (`get_profile_config.cache_clear()` resets it).
     """
+    load_dotenv_once()
+    return _resolve_profile_config(
+        os.getenv("BRAVE_USER_DATA_DIR", ""),
+        os.getenv("BRAVE_PROFILE_NAME", "Default"),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_profile_config(user_data_dir: str, profile_name: str) -> tuple[str, str]:
+    """Worker for :func:`get_profile_config`, memoised per env values."""
     # Check environment variables first
-    user_data_dir = os.getenv("BRAVE_USER_DATA_DIR")
-    profile_name = os.getenv("BRAVE_PROFILE_NAME", "Default")
-    
     if user_data_dir:
         # Expand user path if needed
         user_data_dir = os.path.expanduser(user_data_dir)
@@ -129,6 +152,7 @@ def get_profile_config() -> tuple[str, str]:
         return user_data_dir, profile_name
     
     # Determine default Brave profile location by platform
+    import platform
     system = platform.system()
     
     if system == "Windows":
@@ -142,6 +166,63 @@ def get_profile_config() -> tuple[str, str]:
     return default_data_dir, profile_name
 
 
+get_profile_config.cache_clear = _resolve_profile_config.cache_clear
+
+
+# urllib3 pool size for WebDriver commands (Selenium's default is 1)
+_COMMAND_POOL_MAXSIZE = 10
+
+
+def _widen_command_pool(driver, maxsize: int = _COMMAND_POOL_MAXSIZE) -> None:
+    """
+    Raise the command executor's urllib3 pool ``maxsize`` after construction.
+
+    Works across Selenium 4.x: the PoolManager's ``connection_pool_kw`` is
+    updated and existing pools are dropped, so the next command opens a
+    pool of the new size.
+    """
+    conn = getattr(getattr(driver, "command_executor", None), "_conn", None)
+    pool_kw = getattr(conn, "connection_pool_kw", None)
+    if pool_kw is None:
+        log.debug("Command executor has no urllib3 pool manager – pool size left as is")
+        return
+    pool_kw["maxsize"] = maxsize
+    conn.clear()
+    log.debug(f"WebDriver command pool maxsize set to {maxsize}")
+
+
+def _ensure_keep_alive(driver) -> None:
+    """
+    Make sure WebDriver commands reuse their HTTP connection instead of
+    paying a TCP handshake each.  Selenium keeps the flag on the executor
+    (older 4.x) or on its ClientConfig (newer 4.x); both are forced on.
+    """
+    executor = getattr(driver, "command_executor", None)
+    holder = getattr(executor, "_client_config", None) or executor
+    if holder is None or not hasattr(holder, "keep_alive"):
+        log.warning("Could not determine WebDriver keep-alive status – commands may reconnect")
+        return
+    if not holder.keep_alive:
+        holder.keep_alive = True
+        # With keep-alive off at construction Selenium never built the
+        # persistent PoolManager it uses once the flag is on
+        if getattr(executor, "_conn", None) is None:
+            executor._conn = executor._get_connection_manager()
+        log.info("WebDriver HTTP keep-alive was off – enabled")
+    else:
+        log.info("WebDriver HTTP keep-alive: enabled")
+
+
+def _zero_implicit_wait(driver) -> None:
+    """
+    Set the driver's implicit wait to 0.  The codebase relies on explicit
+    waits, and a non-zero implicit wait makes every missed probe block.
+    Applied once, at creation, to drivers we build; drivers from other
+    factories keep their own setting (ensure_iframe_context leaves it alone).
+    """
+    driver.implicitly_wait(0)
+
+
 def create_brave_driver(
     *,
     headless: bool = False,
@@ -150,7 +231,7 @@ def create_brave_driver(
     maximize: bool = True,
     enable_stealth: bool = True,
     **kwargs
-) -> WebDriver:
+) -> "WebDriver":
     """
     Create a stealth Brave WebDriver instance with automatic configuration.
     
@@ -171,7 +252,8 @@ def create_brave_driver(
     maximize : bool, default True
         Maximize browser window on startup
     enable_stealth : bool, default True
-        Enable stealth patches (disable for debugging)
+        Enable stealth patches (disable for debugging). Set STEALTH_VERIFY=1
+        to also log a navigator.webdriver check after startup.
     **kwargs
         Additional arguments passed to create_stealth_driver
     
@@ -202,6 +284,11 @@ def create_brave_driver(
     Headless mode:
     >>> driver = create_brave_driver(headless=True)
     """
+    from pathlib import Path
+    
+    # Import our stealth package
+    import Auferstehung as uc
+    
     try:
         log.info("🚀 Configuring Brave WebDriver with my_stealth...")
         
@@ -242,8 +329,18 @@ def create_brave_driver(
         
         log.info("✅ Brave WebDriver configured successfully!")
         
-        # Verify stealth is working
-        if enable_stealth:
+        # Let concurrent WebDriver commands (session watcher, phase polling)
+        # use their own sockets instead of queueing on a single connection
+        _ensure_keep_alive(driver)
+        _widen_command_pool(driver)
+        
+        # Explicit waits only – an implicit wait would make every failed
+        # find_element inside a WebDriverWait poll block on its own timeout
+        _zero_implicit_wait(driver)
+        
+        # Verify stealth is working – opt-in (STEALTH_VERIFY=1), it costs two
+        # extra WebDriver round-trips on every driver start
+        if enable_stealth and os.getenv("STEALTH_VERIFY", "0") == "1":
             try:
                 driver.get("about:blank")
                 webdriver_hidden = driver.execute_script("return navigator.webdriver === undefined;")
@@ -263,7 +360,7 @@ def create_brave_driver_uc_compatible(
     use_subprocess=True,
     version_main=None,
     **kwargs
-) -> WebDriver:
+) -> "WebDriver":
     """
     UC-compatible interface for easy migration from undetected-chromedriver.
     
@@ -321,13 +418,149 @@ def create_brave_driver_uc_compatible(
     )
 
 
+# ---------------------------------------------------------------------------
+# Driver pool – hand warm browsers back out instead of relaunching
+# ---------------------------------------------------------------------------
+# Idle drivers keyed by (brave_path, user_data_dir, profile_dir_name, headless).
+# A user-data-dir can only be held by one browser at a time, so each key may
+# have at most _DRIVER_POOL_MAX drivers alive (idle + checked out + being
+# launched); callers beyond that wait for one to be returned.
+_DRIVER_POOL: dict = {}
+_DRIVER_POOL_BUSY: dict = {}   # key -> drivers checked out or being launched
+_DRIVER_POOL_COND = threading.Condition()
+_DRIVER_POOL_MAX = int(os.getenv("BRAVE_DRIVER_POOL_MAX", "1"))
+
+
+def _pool_key(headless: bool, profile_path: Optional[str], profile_name: Optional[str]) -> tuple:
+    """
+    Resolve the pool key the same way create_brave_driver resolves its
+    profile (`.env` is loaded first by the path helpers, as it would be by
+    the stealth package import there).
+    """
+    if profile_path:
+        user_data_dir, profile_dir_name = os.path.expanduser(profile_path), profile_name or "Default"
+    else:
+        user_data_dir, profile_dir_name = get_profile_config()
+    return (find_brave_browser(), user_data_dir, profile_dir_name, headless)
+
+
+def acquire_brave_driver(
+    *,
+    headless: bool = False,
+    profile_path: Optional[str] = None,
+    profile_name: Optional[str] = None,
+    wait_timeout: float = 60.0,
+    **kwargs
+) -> "WebDriver":
+    """
+    Check out a warm driver for this binary/profile from the pool, or launch
+    one with `create_brave_driver()` (remaining kwargs are only used then).
+
+    Return it with `return_brave_driver()` rather than `quit()`.  While the
+    key is at capacity, other callers block for up to *wait_timeout* seconds
+    and then get a TimeoutError.  This pool is separate from
+    configure_brave_driver's, which checks drivers out the same way.
+    """
+    key = _pool_key(headless, profile_path, profile_name)
+    with _DRIVER_POOL_COND:
+        if not _DRIVER_POOL_COND.wait_for(
+            lambda: _DRIVER_POOL.get(key) or _DRIVER_POOL_BUSY.get(key, 0) < _DRIVER_POOL_MAX,
+            timeout=wait_timeout,
+        ):
+            raise TimeoutError(
+                f"No pooled Brave driver for {key[1]}/{key[2]} returned after {wait_timeout}s"
+            )
+        idle = _DRIVER_POOL.get(key)
+        driver = idle.pop() if idle else None
+        _DRIVER_POOL_BUSY[key] = _DRIVER_POOL_BUSY.get(key, 0) + 1
+
+    # Liveness probe and launch run without the lock; the busy count keeps
+    # the key reserved meanwhile
+    try:
+        if driver is not None:
+            try:
+                driver.current_window_handle  # cheap liveness probe
+                log.info(f"♻️ Reusing pooled Brave driver for {key[1]}/{key[2]}")
+                driver._brave_checked_out = True
+                return driver
+            except Exception as e:
+                log.warning(f"Pooled driver is no longer alive, relaunching: {e}")
+            # Quit it so it does not keep holding the profile lock
+            try:
+                driver.quit()
+            except Exception as e:
+                log.debug(f"Error quitting dead pooled driver: {e}")
+
+        driver = create_brave_driver(
+            headless=headless,
+            profile_path=key[1],
+            profile_name=key[2],
+            **kwargs
+        )
+        driver._brave_pool_key = key
+        driver._brave_checked_out = True
+        return driver
+    except BaseException:
+        with _DRIVER_POOL_COND:
+            _DRIVER_POOL_BUSY[key] -= 1
+            _DRIVER_POOL_COND.notify_all()
+        raise
+
+
+def return_brave_driver(driver: "WebDriver") -> None:
+    """
+    Reset *driver* (cookies cleared, parked on about:blank) and put it back
+    in the pool; quits it instead if the reset fails.  Cookies are kept on
+    the user's real Brave profile (the default when BRAVE_USER_DATA_DIR is
+    unset) so their sessions survive.
+    """
+    key = getattr(driver, "_brave_pool_key", None)
+    if key is None:
+        driver.quit()
+        return
+    if not getattr(driver, "_brave_checked_out", False):
+        log.debug("Driver was already returned to the pool – ignoring")
+        return
+    try:
+        if not is_real_brave_profile(key[1]):
+            driver.delete_all_cookies()
+        driver.get("about:blank")
+    except Exception as e:
+        log.warning(f"Could not reset driver for reuse, quitting it: {e}")
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        driver._brave_checked_out = False
+        driver = None
+    with _DRIVER_POOL_COND:
+        _DRIVER_POOL_BUSY[key] -= 1
+        if driver is not None:
+            driver._brave_checked_out = False
+            _DRIVER_POOL.setdefault(key, []).append(driver)
+        _DRIVER_POOL_COND.notify_all()
+
+
+def close_idle_brave_drivers() -> None:
+    """Quit every idle driver returned to the acquire/return pool (call once at shutdown)."""
+    with _DRIVER_POOL_COND:
+        while _DRIVER_POOL:
+            _, idle = _DRIVER_POOL.popitem()
+            for driver in idle:
+                try:
+                    driver.quit()
+                except Exception as e:
+                    log.debug(f"Error quitting pooled driver: {e}")
+        _DRIVER_POOL_COND.notify_all()
+
+
 # Convenience aliases for different use cases
-def get_brave_driver(**kwargs) -> WebDriver:
+def get_brave_driver(**kwargs) -> "WebDriver":
     """Alias for create_brave_driver - matches naming from test files."""
     return create_brave_driver(**kwargs)
 
 
-def configure_chrome_driver(**kwargs) -> WebDriver:
+def configure_chrome_driver(**kwargs) -> "WebDriver":
     """
     Drop-in replacement for the original configure_chrome_driver function.
     Now uses my_stealth instead of UC with much simpler configuration.
@@ -392,125 +625,359 @@ def wait_for_element(driver, data_locator, is_test_attr=False, timeout=10):
         logging.error(f"Failed to find element with {attr}={data_locator}: {str(e)}")
         return None
 
+# High5 session-expired check is debounced to once per interval (seconds);
+# the one-element list holds the monotonic time of the last completed check
+_SESSION_CHECK_INTERVAL = 2.0
+_last_session_check = [0.0]
+
+# Explicit WebDriverWait poll intervals for the phase checks: the short
+# probes are expected to fail often, the status wait can poll coarsely.
+_PROBE_POLL_FREQUENCY = 0.2
+_STATUS_POLL_FREQUENCY = 1.0
+
+# High5 (limitless) action buttons – selectors are constant, built once
+_HIGH5_ACTION_BUTTONS = ('hit', 'stand', 'double', 'split')
+_HIGH5_PER_BUTTON_SELECTORS = tuple(
+    f'.hit-stand-actions-panel .{button}-icon[data-action="{button}"]'
+    for button in _HIGH5_ACTION_BUTTONS
+)
+_HIGH5_COMBINED_SELECTOR = ', '.join(_HIGH5_PER_BUTTON_SELECTORS)
+
+# data-locator/data-action + visible/enabled state of every element matching
+# arguments[0], in DOM order – replaces per-element is_displayed()/is_enabled()
+# round-trips
+_BUTTON_STATES_EXPR = """
+Array.from(document.querySelectorAll(arguments[0])).map(e => {
+    const r = e.getBoundingClientRect();
+    return {
+        loc: e.getAttribute('data-locator'),
+        action: e.getAttribute('data-action'),
+        visible: r.width > 0 && r.height > 0 && getComputedStyle(e).visibility !== 'hidden',
+        enabled: !e.disabled
+    };
+})
+"""
+_BUTTON_STATES_JS = "return " + _BUTTON_STATES_EXPR + ";"
+
+# Everything that is not a digit or '.' in a 360 chip-value label
+_CHIP_NUMERIC_RE = re.compile(r'[^\d.]')
+
+@functools.lru_cache(maxsize=16)
+def _chip_value_locator(seat_num: int) -> str:
+    """CSS locator for the main-bet chip value on *seat_num* (built once per seat)."""
+    return (
+        f"[data-locator='seat-place-{seat_num}-main'] "
+        "[data-locator='betPlace-chip-value-main'] [data-locator='chip-value']"
+    )
+
+
+# 360 action buttons (data-locator values); bit i of the ACTION bitmask
+# returned by get_game_phase_js corresponds to _360_ACTION_LOCATORS[i]
+_360_ACTION_LOCATORS = ('hit-button', 'stand-button', 'double-button', 'split-button')
+_360_ACTION_BITS = {loc: 1 << i for i, loc in enumerate(_360_ACTION_LOCATORS)}
+_360_ACTION_SELECTOR = ", ".join(f"button[data-locator='{loc}']" for loc in _360_ACTION_LOCATORS)
+
+
+def _high5_states_from(buttons):
+    """
+    Actionable flags aligned with _HIGH5_ACTION_BUTTONS from the button list
+    returned by _BUTTON_STATES_EXPR (first match per action wins).
+    """
+    states = {}
+    for btn in buttons:
+        states.setdefault(btn['action'], btn['visible'] and btn['enabled'])
+    return [states.get(button, False) for button in _HIGH5_ACTION_BUTTONS]
+
+
+def _high5_action_states(driver):
+    """
+    High5 actionable flags read in one execute_script.  Returns None when no
+    button is actionable, so it can drive a WebDriverWait directly.
+    """
+    action_states = _high5_states_from(
+        driver.execute_script(_BUTTON_STATES_JS, _HIGH5_COMBINED_SELECTOR)
+    )
+    return action_states if any(action_states) else None
+
+
+def _mask_to_details(mask):
+    """
+    Expand a 360 ACTION bitmask into the list-of-dicts form
+    (``[{'type': 'hit-button', 'enabled': True, 'visible': True}, ...]``)
+    for callers that want per-button details.
+    """
+    return [
+        {'type': loc, 'enabled': True, 'visible': True}
+        for i, loc in enumerate(_360_ACTION_LOCATORS)
+        if mask >> i & 1
+    ]
+
+# Trimmed, upper-cased High5 status-bar text ('' if the element is missing);
+# innerText matches what WebElement.text used to return
+_HIGH5_STATUS_TEXT_EXPR = (
+    "(e => e ? (e.innerText || e.textContent || '').trim().toUpperCase() : '')"
+    "(document.querySelector('.status-text.ui-text-shadow-dark-strong'))"
+)
+_HIGH5_STATUS_TEXT_JS = "return " + _HIGH5_STATUS_TEXT_EXPR + ";"
+
+# Status text + every High5 button's state in a single round-trip
+_HIGH5_FUSED_PROBE_JS = (
+    "return {status: " + _HIGH5_STATUS_TEXT_EXPR + ", buttons: " + _BUTTON_STATES_EXPR + "};"
+)
+
+# Gravity snapshot: phase, actionable buttons and the frame/context
+# probe in one round-trip.  Kept as one constant string (wrapped in an arrow
+# function) so the browser sees the identical source on every poll.
+_GRAV_PHASE_EXPR = """(() => {
+    const bet = document.querySelector('[data-locator="main-bet-place"]');
+    const resp = {
+        phase: "WAITING",
+        buttons: [],
+        top: window.top === window,
+        contextOk: bet !== null
+            || document.querySelector('[data-locator="balance-amount"]') !== null,
+    };
+
+    if (bet) {
+        // classList lookups are hashed, no substring scans of className
+        const cl = bet.classList;
+        if (!cl.contains("betPlace_withChip")
+                && cl.contains("betPlace_enabled")
+                && cl.contains("betPlace_withoutChip")
+                && !cl.contains("betPlace_roundState_waiting")) {
+            resp.phase = "BETTING";
+            return resp;
+        }
+    }
+
+    // one DOM walk for all four buttons, filtered in JS: only actionable
+    // (enabled + visible) buttons are returned, once per id, with their state
+    // so callers never need follow-up is_enabled()/is_displayed()
+    const allowed = new Set(["hit", "stand", "double", "split"]);
+    const seen = new Set();
+    document.querySelectorAll('button[data-locator$="-button"]').forEach(btn => {
+        const id = btn.getAttribute("data-locator").slice(0, -"-button".length);
+        if (!allowed.has(id) || seen.has(id)) return;
+        if (btn.disabled || btn.offsetParent === null) return;
+        seen.add(id);
+        resp.buttons.push({
+            id: id,
+            disabled: false,
+            visible: true,
+            text: (btn.textContent || "").trim(),
+        });
+    });
+
+    if (resp.buttons.length) resp.phase = "ACTION";
+    return resp;
+})()"""
+
+# Observer variant used by get_game_phase_js: the first call inside the game
+# frame installs a MutationObserver that re-runs the snapshot (once per batch
+# of mutations, coalesced in a microtask – timers are throttled in hidden
+# tabs, microtasks are not) whenever a class, disabled, hidden or style
+# attribute (or the child list) changes and parks the result in
+# window.__gravPhase; later polls only read it back.  A reload or new frame
+# document starts without the global, so it re-installs itself.  In the top
+# document (out of frame) nothing is installed – a one-shot snapshot is
+# returned so the caller can recover into the frame.
+_GRAV_OBSERVED_PHASE_JS = """
+if (window.top === window) {
+    return """ + _GRAV_PHASE_EXPR + """;
+}
+if (!window.__gravPhase) {
+    let pending = false;
+    const update = () => { window.__gravPhase = """ + _GRAV_PHASE_EXPR + """; };
+    const schedule = () => {
+        if (pending) return;
+        pending = true;
+        queueMicrotask(() => { pending = false; update(); });
+    };
+    update();
+    new MutationObserver(schedule).observe(document.body || document.documentElement, {
+        subtree: true,
+        childList: true,
+        attributes: true,
+        attributeFilter: ["class", "disabled", "hidden", "style"],
+    });
+}
+return window.__gravPhase;
+"""
+
+# Async variant: re-runs the snapshot in-page every _GRAV_WAIT_POLL_MS and
+# calls back as soon as the phase differs from arguments[0] (or the frame
+# context is lost), or after arguments[1] ms – one round-trip per change
+_GRAV_WAIT_POLL_MS = 50
+_GRAV_PHASE_WAIT_JS = """
+const done = arguments[arguments.length - 1];
+const last = arguments[0];
+const deadline = Date.now() + arguments[1];
+const check = () => {
+    const resp = """ + _GRAV_PHASE_EXPR + """;
+    if (resp.phase !== last || resp.top || Date.now() >= deadline) {
+        done(resp);
+    } else {
+        setTimeout(check, """ + str(_GRAV_WAIT_POLL_MS) + """);
+    }
+};
+check();
+"""
+
+# Gravity snapshot phase string → game phase
+_GRAV_PHASE_MAP = {
+    "BETTING": GamePhase.BETTING,
+    "ACTION": GamePhase.ACTION,
+    "WAITING": GamePhase.WAITING,
+}
+
+# High5 status-bar text → game phase; also the set of texts we recognise
+_HIGH5_PHASE_MAP = {
+    "PLACE YOUR PLAY": GamePhase.BETTING,
+    "WAITING FOR PLAYER SEAT ACTIONS": GamePhase.ACTION,
+    "WAITING FOR DEALER CARDS": GamePhase.WAITING_FOR_DEALER_CARDS,
+    "WAITING FOR PLAYER CARDS": GamePhase.WAITING_FOR_PLAYER_CARDS,
+    "SHOWING WINNERS": GamePhase.SHOWING_WINNERS,
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _resolved_site() -> str:
+    """
+    Lower-cased SITE name, read from the environment once per process –
+    the phase poll and ensure_iframe_context() both need it on every tick.
+    """
+    return os.getenv('SITE', 'mcluck').lower()
+
+
+@functools.lru_cache(maxsize=1)
+def _resolved_site_config():
+    """SITE_CONFIGS entry for the configured SITE, or None if it is unknown."""
+    return SITE_CONFIGS.get(_resolved_site())
+
+
+@functools.lru_cache(maxsize=1)
+def _resolved_game_type() -> str:
+    """
+    Game type for the configured SITE, resolved once per process – the
+    phase poll reads it many times a second.  Defaults to 'gravity' if the
+    site config is missing or has no type.
+    """
+    config = _resolved_site_config()
+    return config.get('game_type', 'gravity') if config else 'gravity'
+
+
 def get_game_phase_js(driver):
     """
     Determine the current game phase using Selenium.
     Returns: Tuple of (GamePhase enum value, found_buttons or None)
+    For 360 games, found_buttons in the ACTION phase is an int bitmask over
+    _360_ACTION_LOCATORS (expand with _mask_to_details()).
+    For Gravity games, found_buttons in the ACTION phase is a non-empty list
+    of {'id', 'disabled', 'visible', 'text'} dicts, one per actionable
+    (enabled and visible) hit/stand/double/split button.
     For High5 games, waits up to 10 seconds for a valid status message before defaulting to WAITING.
     """
-    # Get site configuration at the start
-    site = os.getenv('SITE', 'mcluck').lower()
-    config = SITE_CONFIGS.get(site)
-    # Determine game type, default to 'gravity' if config not found or type missing
-    game_type = config.get('game_type', 'gravity') if config else 'gravity'
+    game_type = _resolved_game_type()
     
     try:
         # Check if we're using High5 (limitless)
         if game_type == 'limitless': # Check game_type instead of site == 'high5'
-            # First check for session expiration
-            try:
-                if check_session_expired_flag(driver):
-                    logging.warning("Session expiration detected in game phase check")
-                    return None, None  # Signal to break out of any loops
-            except Exception as e:
-                logging.debug(f"Error checking session expiration: {str(e)}")
+            # First check for session expiration (debounced – at most once
+            # per _SESSION_CHECK_INTERVAL; a healthy session is the norm)
+            now = time.monotonic()
+            if now - _last_session_check[0] > _SESSION_CHECK_INTERVAL:
+                try:
+                    expired = check_session_expired_flag(driver)
+                    _last_session_check[0] = now
+                    if expired:
+                        logging.warning("Session expiration detected in game phase check")
+                        return None, None  # Signal to break out of any loops
+                except Exception as e:
+                    logging.debug("Error checking session expiration: %s", e)
             
             # logging.debug("Checking High5 game phase...")
             
-            # Ensure we're in the game iframe
-            driver.switch_to.default_content()
+            # Ensure we're in the game iframe – only switch frames if a cheap
+            # probe says we're at the top level (same fast path as gravity)
+            # (already at the top document, so no default_content() needed)
+            if driver.execute_script("return window.top === window;"):
+                try:
+                    switched = _switch_to_frame(driver, By.ID, "game-iframe")
+                except WebDriverException as e:
+                    logging.debug("Error switching to game frame in phase check: %s", e)
+                    return GamePhase.WAITING, None
+                if not switched:
+                    logging.debug("High5 game frame not found in phase check")
+                    return GamePhase.WAITING, None
+            
+            # Fast path: one round-trip for the status text and every button's
+            # state; the slow wait below only runs while the status is empty/unknown
             try:
-                WebDriverWait(driver, 1).until(
-                    EC.frame_to_be_available_and_switch_to_it((By.ID, "game-iframe"))
-                )
-            except Exception as e:
-                logging.debug(f"Error switching to game frame in phase check: {str(e)}")
-                return GamePhase.WAITING, None
+                probe = driver.execute_script(_HIGH5_FUSED_PROBE_JS, _HIGH5_COMBINED_SELECTOR)
+                phase = _HIGH5_PHASE_MAP.get(probe['status'])
+                if phase is not None:
+                    if phase == GamePhase.BETTING:
+                        return phase, None
+                    action_states = _high5_states_from(probe['buttons'])
+                    if any(action_states):
+                        return GamePhase.ACTION, action_states
+                    if phase != GamePhase.ACTION:
+                        logging.debug("In %s phase", phase.name)
+                    return phase, None
+            except (WebDriverException, KeyError, TypeError) as e:
+                logging.debug("High5 fused phase probe failed, falling back: %s", e)
             
             def wait_for_valid_status(driver):
-                """Wait for a valid status message to appear"""
+                """Wait for a valid status message to appear ('' keeps the wait polling)"""
                 try:
-                    status_element = driver.find_element(By.CSS_SELECTOR, '.status-text.ui-text-shadow-dark-strong')
-                    if not status_element:
-                        return None
-                        
-                    status_text = status_element.text.strip().upper()
-                    if not status_text:
-                        return None
+                    # One round-trip: locate + read + normalise the status text in JS
+                    status_text = driver.execute_script(_HIGH5_STATUS_TEXT_JS)
                         
                     # Return the status text if it's one we recognize
-                    if status_text in [
-                        "PLACE YOUR PLAY",
-                        "WAITING FOR PLAYER SEAT ACTIONS",
-                        "WAITING FOR DEALER CARDS",
-                        "WAITING FOR PLAYER CARDS",
-                        "SHOWING WINNERS"
-                    ]:
-                        return status_text
-                    return None
-                except:
-                    return None
+                    return status_text if status_text in _HIGH5_PHASE_MAP else ''
+                except WebDriverException:
+                    return ''
             
             try:
-                # Wait up to 5 seconds for a valid status message
-                status_text = WebDriverWait(driver, 10).until(wait_for_valid_status)
+                # Wait up to 10 seconds for a valid status message; coarse
+                # polling is plenty for a status bar and halves round-trips
+                status_text = WebDriverWait(
+                    driver, 10, poll_frequency=_STATUS_POLL_FREQUENCY
+                ).until(wait_for_valid_status)
                 
-                # Map status text to game phases
-                # BETTING PHASE: When it's time for the player to place their bet
-                if status_text == "PLACE YOUR PLAY":
-                    return GamePhase.BETTING, None
+                # Map status text to game phases (one hashed lookup)
+                phase = _HIGH5_PHASE_MAP[status_text]
                 
-                # Check for clickable action buttons first
-                action_buttons = ['hit', 'stand', 'double', 'split']
-                action_states = []
-                
-                # Create a combined selector for all action buttons
-                combined_selector = ', '.join([
-                    f'.hit-stand-actions-panel .{button}-icon[data-action="{button}"]' 
-                    for button in action_buttons
-                ])
+                # BETTING PHASE: When it's time for the player to place their bet
+                if phase == GamePhase.BETTING:
+                    return phase, None
                 
                 # ACTION PHASE: Either buttons are clickable or status indicates player action
                 try:
-                    # Wait for any action button to become clickable (1 second timeout)
-                    WebDriverWait(driver, 1).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, combined_selector))
+                    if phase == GamePhase.ACTION:
+                        # Status already says ACTION – a single read of the button
+                        # states replaces the 1 second clickable wait
+                        return GamePhase.ACTION, _high5_action_states(driver)
+                    # Wait (1 second timeout) until any action button is clickable; each
+                    # poll is one round-trip that already returns every button's state
+                    action_states = WebDriverWait(driver, 1, poll_frequency=_PROBE_POLL_FREQUENCY).until(
+                        _high5_action_states
                     )
-                    
-                    # If we get here, at least one button is clickable, now check state of all buttons
-                    for button in action_buttons:
-                        selector = f'.hit-stand-actions-panel .{button}-icon[data-action="{button}"]'
-                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                        is_enabled = elements and elements[0].is_displayed() and elements[0].is_enabled()
-                        action_states.append(is_enabled)
-                        
                     return GamePhase.ACTION, action_states
-                except:
-                    # If no buttons are clickable, check the status text
-                    if status_text == "WAITING FOR PLAYER SEAT ACTIONS":
-                        return GamePhase.ACTION, None
+                except WebDriverException:
+                    # If no buttons are clickable, the status text decides
+                    pass
                 
-                # HIGH5-SPECIFIC PHASES: More granular state tracking for High5 games
-                if status_text == "WAITING FOR DEALER CARDS":
-                    logging.debug("In WAITING_FOR_DEALER_CARDS phase")
-                    return GamePhase.WAITING_FOR_DEALER_CARDS, None
-                    
-                elif status_text == "WAITING FOR PLAYER CARDS":
-                    logging.debug("In WAITING_FOR_PLAYER_CARDS phase")
-                    return GamePhase.WAITING_FOR_PLAYER_CARDS, None
-                    
-                elif status_text == "SHOWING WINNERS":
-                    logging.debug("In SHOWING_WINNERS phase")
-                    return GamePhase.SHOWING_WINNERS, None
+                # ACTION ("WAITING FOR PLAYER SEAT ACTIONS") or one of the
+                # HIGH5-SPECIFIC PHASES: more granular state tracking for High5 games
+                if phase != GamePhase.ACTION:
+                    logging.debug("In %s phase", phase.name)
+                return phase, None
                     
-            except Exception as e:
-                logging.debug(f"Timed out waiting for valid status text: {str(e)}")
+            except WebDriverException as e:
+                logging.debug("Timed out waiting for valid status text: %s", e)
                 return GamePhase.WAITING, None
                 
-            # If we somehow get here without a valid status, return WAITING
-            logging.debug("No valid status text found after wait - defaulting to WAITING phase")
-            return GamePhase.WAITING, None
-                
         # --- 360 Variant Check ---
         elif game_type == '360': # Check game_type instead of site list
             # For 360 variants, the betting phase is primarily indicated by the betting timer,
@@ -521,7 +988,7 @@ def get_game_phase_js(driver):
                         # REFACTOR: Use WebDriverWait to look for the timer for a short period (e.g., 1 second)
                         # instead of find_element, which fails immediately if the element isn't present.
                         # This makes the check more robust against timing issues where the element might load slightly late.
-                        timer_element = WebDriverWait(driver, 1).until(
+                        timer_element = WebDriverWait(driver, 1, poll_frequency=_PROBE_POLL_FREQUENCY).until(
                             EC.visibility_of_element_located((By.CSS_SELECTOR, '[data-locator="betting-timer"]'))
                         )
                         # If the wait succeeds and finds the element visible, we are in the betting phase.
@@ -534,7 +1001,7 @@ def get_game_phase_js(driver):
                             seat_num = session_state.current_seat
                             if seat_num is not None:
                                 # Construct the locator for the chip value text within our seat
-                                chip_value_locator = f"[data-locator='seat-place-{seat_num}-main'] [data-locator='betPlace-chip-value-main'] [data-locator='chip-value']"
+                                chip_value_locator = _chip_value_locator(seat_num)
                                 
                                 # Use find_elements to avoid NoSuchElementException if bet isn't placed yet
                                 chip_value_elements = driver.find_elements(By.CSS_SELECTOR, chip_value_locator)
@@ -544,23 +1011,25 @@ def get_game_phase_js(driver):
                                     # Check if the text represents a non-zero number
                                     try:
                                         # Remove currency symbols or other non-numeric chars if necessary (adjust regex if needed)
-                                        numeric_text = ''.join(filter(lambda x: x.isdigit() or x == '.', chip_text))
+                                        numeric_text = _CHIP_NUMERIC_RE.sub('', chip_text)
                                         bet_amount = float(numeric_text)
                                         if bet_amount > 0:
                                             bet_already_placed = True
-                                            logging.debug(f"(360) Existing bet of {bet_amount} detected on seat {seat_num}. Treating phase as WAITING.")
+                                            logging.debug("(360) Existing bet of %s detected on seat %s. Treating phase as WAITING.", bet_amount, seat_num)
                                         else:
-                                            logging.debug(f"(360) Chip value element found but shows {bet_amount}. Treating as BETTING.")
+                                            logging.debug("(360) Chip value element found but shows %s. Treating as BETTING.", bet_amount)
                                     except ValueError:
-                                         logging.debug(f"(360) Could not parse chip value text '{chip_text}'. Assuming no bet placed.")
+                                         logging.debug("(360) Could not parse chip value text '%s'. Assuming no bet placed.", chip_text)
                                 else:
                                     logging.debug("(360) Chip value element not found or not displayed. Treating as BETTING.")
                             else:
                                 # This case might occur if we just took the seat and haven't bet
                                 logging.debug("(360) current_seat is None in session_state while checking for existing bet. Cannot check.")
                                 
-                        except Exception as bet_check_err:
-                            logging.warning(f"(360) Error checking for existing bet chip: {type(bet_check_err).__name__}. Proceeding cautiously.")
+                        except NoSuchWindowException:
+                            raise
+                        except WebDriverException as bet_check_err:
+                            logging.warning("(360) Error checking for existing bet chip: %s. Proceeding cautiously.", type(bet_check_err).__name__)
                             # Decide how to handle error: assume no bet placed to avoid getting stuck?
                             bet_already_placed = False 
                             
@@ -578,9 +1047,11 @@ def get_game_phase_js(driver):
                         # If the timer doesn't appear within the timeout, it's not the betting phase (or the element is missing).
                         # Log this and proceed to check for action buttons as the next step.
                         logging.debug("(360) Betting timer not found/visible within timeout. Checking action buttons.")
-                    except Exception as e:
+                    except NoSuchWindowException:
+                        raise
+                    except WebDriverException as e:
                         # Catch other potential errors during the WebDriverWait itself.
-                        logging.warning(f"(360) Error checking for betting timer: {type(e).__name__}")
+                        logging.warning("(360) Error checking for betting timer: %s", type(e).__name__)
                     # If we reach here, the timer wasn't found or there was an error checking it.
                     # The original code had a logging.debug("(360) Betting timer not visible.") here, 
                     # which is now covered by the TimeoutException logging above.
@@ -594,39 +1065,31 @@ def get_game_phase_js(driver):
                 # If timer logic didn't return BETTING or WAITING, proceed to check action buttons.
                 # Prioritize direct Selenium check over potentially failing JS.
                 action_buttons_present = False
-                button_details = [] # Store details of enabled buttons
+                enabled_mask = 0 # Bit i set = _360_ACTION_LOCATORS[i] is actionable
                 try:
-                    action_button_locators = [
-                        'hit-button',
-                        'stand-button',
-                        'double-button',
-                        'split-button'
-                    ]
-                    combined_selector = ", ".join([f"button[data-locator='{loc}']" for loc in action_button_locators])
-                    
-                    # Use find_elements which returns empty list if none found
-                    possible_buttons = driver.find_elements(By.CSS_SELECTOR, combined_selector)
+                    # One round-trip for every button's locator + visible/enabled state
+                    # (empty list if none are in the DOM)
+                    possible_buttons = driver.execute_script(_BUTTON_STATES_JS, _360_ACTION_SELECTOR)
                     
                     if possible_buttons:
                         # Check if any of the found buttons are displayed and enabled
                         for btn in possible_buttons:
-                            if btn.is_displayed() and btn.is_enabled():
-                                action_buttons_present = True
-                                button_details.append({
-                                    'type': btn.get_attribute('data-locator'),
-                                    'enabled': True,
-                                    'visible': True
-                                })
+                            if btn['visible'] and btn['enabled']:
+                                enabled_mask |= _360_ACTION_BITS.get(btn['loc'], 0)
+                        action_buttons_present = enabled_mask != 0
                         
                         if action_buttons_present:
-                            logging.debug(f"(360) Action buttons found via Selenium: {[d['type'] for d in button_details]}")
-                            return GamePhase.ACTION, button_details # Return ACTION and button states
+                            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                                logging.debug("(360) Action buttons found via Selenium: %s", [d['type'] for d in _mask_to_details(enabled_mask)])
+                            return GamePhase.ACTION, enabled_mask # Return ACTION and button bitmask
                         else:
                             logging.debug("(360) Action buttons found in DOM via Selenium, but none are displayed/enabled.")
                     else:
                          logging.debug("(360) No action buttons found in DOM via Selenium check.")
-                except Exception as selenium_err:
-                     logging.warning(f"(360) Error during Selenium action button check: {type(selenium_err).__name__}.")
+                except NoSuchWindowException:
+                    raise
+                except (WebDriverException, KeyError, TypeError) as selenium_err:
+                     logging.warning("(360) Error during Selenium action button check: %s.", type(selenium_err).__name__)
                      # If Selenium check errors, we cannot reliably determine the phase
                      action_buttons_present = False # Ensure we don't accidentally proceed
                      # Removed JS Fallback: If Selenium check fails, assume WAITING
@@ -637,149 +1100,219 @@ def get_game_phase_js(driver):
                     logging.debug("(360) No active action buttons confirmed by Selenium check. Returning WAITING phase.")
                     return GamePhase.WAITING, None
                     
-            except Exception as e:
+            except NoSuchWindowException:
+                raise
+            except WebDriverException as e:
                 # Handle potential errors during the overall 360 phase check
-                logging.debug(f"(360) Error during phase check: {type(e).__name__}. Defaulting to WAITING.")
+                logging.debug("(360) Error during phase check: %s. Defaulting to WAITING.", type(e).__name__)
                 return GamePhase.WAITING, None
 
        # --- Standard Gravity (fast path) ------------------------------------------
         elif game_type == "gravity":          # ← keep your existing outer branches
             try:
-                # 0️⃣ only switch frames if a cheap probe says we're out of context
+                # 1️⃣ JS snapshot – pull all the data we need in one go, including
+                #    the frame/context probe that used to be separate round-trips
+                #    (kept current in-page by a MutationObserver, so a poll is a read)
+                result = driver.execute_script(_GRAV_OBSERVED_PHASE_JS)
+
+                # 0️⃣ only switch frames if the snapshot says we're out of context
                 #    (once you're inside the <iframe>, window.top !== window should be True)
-                if driver.execute_script("return window.top === window;"):
-                    if not ensure_iframe_context(driver):          # one‑time recovery
+                if result["top"]:
+                    if not ensure_iframe_context(driver, probe=result):   # one‑time recovery
                         return GamePhase.WAITING, None
-
-                # 1️⃣ JS snapshot – pull all the data we need in one go
-                result = driver.execute_script(
-                    """
-                    const resp = {phase: "WAITING", buttons: []};
-
-                    const bet = document.querySelector('[data-locator="main-bet-place"]');
-                    if (bet) {
-                        const cls = bet.className || "";
-                        const noChip  = cls.includes("betPlace_withoutChip");
-                        const withChip= cls.includes("betPlace_withChip");
-                        const enabled = cls.includes("betPlace_enabled");
-                        const open    = !cls.includes("betPlace_roundState_waiting");
-
-                        if (!withChip && enabled && noChip && open) {
-                            resp.phase = "BETTING";
-                            return resp;
-                        }
-                    }
-
-                    const ids = ["hit", "stand", "double", "split"];
-                    ids.forEach(id => {
-                        const btn = document.querySelector(
-                            `button[data-locator="${id}-button"]`);
-                        if (btn && !btn.disabled && btn.offsetParent !== null) {
-                            resp.buttons.push(id);
-                        }
-                    });
-
-                    if (resp.buttons.length) resp.phase = "ACTION";
-                    return resp;
-                    """
-                )
+                    result = driver.execute_script(_GRAV_OBSERVED_PHASE_JS)
 
                 # 2️⃣ map JS → Python enum once
-                if result["phase"] == "BETTING":
-                    return GamePhase.BETTING, None
-                if result["phase"] == "ACTION":
-                    return GamePhase.ACTION, result["buttons"]
-                return GamePhase.WAITING, None
+                return _grav_phase_from(result)
 
-            except Exception as err:
-                logging.debug(f"Gravity phase check failed: {err}")
+            except NoSuchWindowException:
+                raise
+            except (WebDriverException, KeyError, TypeError) as err:
+                logging.debug("Gravity phase check failed: %s", err)
                 return GamePhase.WAITING, None
 
         
+    except NoSuchWindowException:
+        logging.error("Lost connection to game window")
+        raise
     except Exception as e:
-        if "no such window" in str(e).lower():
-            logging.error("Lost connection to game window")
-            raise
-        logging.debug(f"Error determining game phase: {str(e)}")
+        logging.debug("Error determining game phase: %s", e)
+        return GamePhase.WAITING, None
+
+
+def _grav_phase_from(result):
+    """Map a Gravity snapshot dict to (GamePhase, buttons or None)."""
+    phase = _GRAV_PHASE_MAP.get(result["phase"], GamePhase.WAITING)
+    return phase, (result["buttons"] if phase is GamePhase.ACTION else None)
+
+
+def wait_for_gravity_phase_change(driver, last_phase, timeout_ms=500):
+    """
+    Block in-page until the Gravity phase differs from *last_phase*, or
+    *timeout_ms* elapses, and return it like get_game_phase_js().
+
+    The snapshot is re-evaluated inside the browser via execute_async_script,
+    so a poll loop costs one WebDriver round-trip per phase change instead of
+    one per tick.  Falls back to get_game_phase_js() when the context is lost.
+    """
+    last = getattr(last_phase, 'name', last_phase)
+    try:
+        result = driver.execute_async_script(_GRAV_PHASE_WAIT_JS, last, timeout_ms)
+    except WebDriverException as err:
+        logging.debug("Gravity phase wait failed: %s", err)
         return GamePhase.WAITING, None
+    if result["top"]:
+        return get_game_phase_js(driver)
+    return _grav_phase_from(result)
+
+# (By, selector) frame chain per site, flattened from SITE_CONFIGS once –
+# the static config never changes, so the recovery loop needn't re-unpack it.
+# Sites without a "frames" entry (e.g. high5) are left out rather than
+# failing the import; recovery reports them as unconfigured, as before.
+_FRAME_CHAINS = {
+    site: tuple((frame_type, frame_selector) for frame_type, frame_selector, *_ in cfg["frames"])
+    for site, cfg in SITE_CONFIGS.items()
+    if "frames" in cfg
+}
+
+# Direct frame switches: the frame is normally already there, so try
+# find_element + switch_to.frame and retry once briefly instead of polling
+# frame_to_be_available_and_switch_to_it every 500 ms.
+_FRAME_SWITCH_ATTEMPTS = 2
+_FRAME_SWITCH_RETRY_DELAY = 0.1
+
+
+def _switch_to_frame(driver, by, selector) -> bool:
+    """Switch into the frame matched by (by, selector); True on success."""
+    for attempt in range(_FRAME_SWITCH_ATTEMPTS):
+        try:
+            driver.switch_to.frame(driver.find_element(by, selector))
+            return True
+        except (NoSuchElementException, StaleElementReferenceException):
+            if attempt + 1 < _FRAME_SWITCH_ATTEMPTS:
+                time.sleep(_FRAME_SWITCH_RETRY_DELAY)
+    return False
+
+
+def _already_top(driver) -> bool:
+    """True if the current browsing context is the top-level document."""
+    try:
+        return bool(driver.execute_script("return window.top === window;"))
+    except WebDriverException:
+        return False
+
+
+# Either stable game element present → we're in the game frame
+_STABLE_ELEMENT_JS = (
+    "return document.querySelector("
+    "'[data-locator=\"main-bet-place\"], [data-locator=\"balance-amount\"]') !== null;"
+)
+
+# High5 dealer hand present → we're in the High5 game frame
+_HIGH5_IN_FRAME_JS = "return document.querySelector('.dealer-hand') !== null;"
 
-def ensure_iframe_context(driver):
-    """Ensure we're in the correct iframe context."""
+# The iframe context only changes on navigation/crash, so a successful
+# verification is trusted for _CTX_TTL seconds.  The bot polls one driver,
+# so only the last verified (session_id, timestamp) pair is kept – a
+# different session simply misses and replaces it.
+_CTX_TTL = 0.5
+_ctx_verified = [None, 0.0]
+
+
+def ensure_iframe_context(driver, probe=None):
+    """
+    Ensure we're in the correct iframe context.
+
+    `probe` is an optional snapshot from the phase-check JS carrying a
+    `contextOk` flag; when given, it stands in for the stable-element
+    find_element checks so no extra round-trips are made.  Without a probe,
+    a verification made within the last _CTX_TTL seconds is reused.
+    """
+    key = getattr(driver, 'session_id', None)
+    if (probe is None and key is not None and _ctx_verified[0] == key
+            and time.monotonic() - _ctx_verified[1] < _CTX_TTL):
+        return True
+
+    if _check_iframe_context(driver, probe):
+        _ctx_verified[:] = (key, time.monotonic())
+        return True
+    if _ctx_verified[0] == key:
+        _ctx_verified[:] = (None, 0.0)
+    return False
+
+
+def _check_iframe_context(driver, probe):
+    """Verify (and if needed restore) the iframe context; see ensure_iframe_context()."""
     try:
         # Get current site configuration
-        site = os.getenv('SITE', 'mcluck').lower()
+        site = _resolved_site()
         
         if site == 'high5':
             # For High5, just switch to game frame directly without verification
             # (Assuming High5 doesn't have complex intermediate frames like some others)
-            try:
-                # Check if already in the frame by looking for a known High5 element
-                driver.find_element(By.CSS_SELECTOR, '.dealer-hand') # Example element
+            # Check if already in the frame by looking for a known High5 element
+            # (boolean script – a miss costs no NoSuchElementException)
+            if driver.execute_script(_HIGH5_IN_FRAME_JS):
                 return True # Already in the correct frame
-            except:
-                # Not in the frame, try switching
+            # Not in the frame, try switching
+            if not _already_top(driver):
                 driver.switch_to.default_content()
-                try:
-                    WebDriverWait(driver, 1).until(
-                        EC.frame_to_be_available_and_switch_to_it((By.ID, "game-iframe"))
-                    )
-                    logging.debug("Switched to High5 iframe context.")
-                    return True
-                except Exception as e:
-                    logging.debug(f"Error switching to High5 game frame: {str(e)}")
+            try:
+                if not _switch_to_frame(driver, By.ID, "game-iframe"):
+                    logging.debug("High5 game frame not found")
                     return False
+                logging.debug("Switched to High5 iframe context.")
+                return True
+            except WebDriverException as e:
+                logging.debug("Error switching to High5 game frame: %s", e)
+                return False
         
         # For other sites (Gravity, 360, etc.)
-        try:
-            # More robust check: Look for EITHER main bet spot OR another stable game element
-            # Using balance amount as the alternative stable element.
-            stable_element_found = False
+        if probe is not None:
+            # The phase snapshot already looked for the stable elements
+            if probe.get("contextOk"):
+                return True
+        else:
             try:
-                # Check for main bet spot (Gravity)
-                driver.find_element(By.CSS_SELECTOR, '[data-locator="main-bet-place"]')
-                stable_element_found = True
-                # logging.debug("Context check: Found main-bet-place")
-            except NoSuchElementException:
-                # If main bet spot not found, check for balance amount (Common)
-                try:
-                    driver.find_element(By.CSS_SELECTOR, '[data-locator="balance-amount"]')
-                    stable_element_found = True
-                    # logging.debug("Context check: Found balance-amount")
-                except NoSuchElementException:
-                    # logging.debug("Context check: Neither main-bet-place nor balance-amount found.")
-                    pass # Neither common element found, context might be lost
-            
-            if stable_element_found:
-                # logging.debug("Context check: Stable element found, context assumed correct.")
-                return True # Context is likely correct
-        except Exception as check_err:
-            # Log error during the check, but proceed to recovery attempt
-            logging.debug(f"Error during context check: {check_err}")
-            pass 
+                # More robust check: Look for EITHER main bet spot (Gravity) OR
+                # balance amount (Common) – one boolean-returning script instead of
+                # up to two find_element round-trips with WebElement handles
+                if driver.execute_script(_STABLE_ELEMENT_JS):
+                    return True # Context is likely correct
+            except WebDriverException as check_err:
+                # Log error during the check, but proceed to recovery attempt
+                logging.debug("Error during context check: %s", check_err)
+                pass 
 
         # --- Context recovery logic (if check above failed or skipped) --- 
         logging.warning("Context check failed or skipped, attempting iframe recovery...")
-        driver.switch_to.default_content()
+        # default_content() can be slow on frame-heavy pages; skip it when the
+        # probe (or a one-line check) says we're already at the top document
+        if not (probe is not None and probe.get("top")) and not _already_top(driver):
+            driver.switch_to.default_content()
         
-        # Get current site configuration
-        config = SITE_CONFIGS.get(site)
-        if not config:
-            logging.error(f"Invalid site configuration: {site}")
+        # Get current site's frame chain
+        frames = _FRAME_CHAINS.get(site)
+        if frames is None:
+            logging.error("Invalid site configuration: %s", site)
             return False
         
         # Follow the frame chain from the site configuration
-        for frame_type, frame_selector, *extra in config["frames"]:
+        for frame_type, frame_selector in frames:
             try:
-                WebDriverWait(driver, 0.5).until(
-                    EC.frame_to_be_available_and_switch_to_it((frame_type, frame_selector))
-                )
-            except Exception as e:
-                logging.debug(f"Error switching to frame {frame_selector}: {str(e)}")
+                if not _switch_to_frame(driver, frame_type, frame_selector):
+                    logging.debug("Frame %s not found", frame_selector)
+                    return False
+            except WebDriverException as e:
+                logging.debug("Error switching to frame %s: %s", frame_selector, e)
                 return False
         
         logging.debug("Successfully restored iframe context")
         return True
         
-    except Exception as e:
-        logging.debug(f"Error ensuring iframe context: {str(e)}")
+    except NoSuchWindowException:
+        # The window is gone – nothing to recover, let the caller see it
+        raise
+    except WebDriverException as e:
+        logging.debug("Error ensuring iframe context: %s", e)
         return False
\ No newline at end of file
@@ -21,6 +21,8 @@ Environment variables (optional but recommended):
     (used only when no real profile is provided or session is not present).
   - GOOGLE_EMAIL, GOOGLE_PASSWORD: Credentials for Google OAuth login
     (used only when no real profile is provided; real profile should skip this).
+  - MCLUCK_SESSION_FILE: Where session cookies are saved after a successful
+    login and replayed on the next run (default: ./.mcluck_session.json).
 
 Usage from terminal (Windows CMD example):
   set MCLUCK_MODE=GC
@@ -47,7 +49,6 @@ import logging
 from typing import Optional, Tuple
 import json
 import threading
-import json
 
 from dotenv import load_dotenv
 
@@ -59,7 +60,13 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    NoSuchFrameException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
 
 
 log = logging.getLogger(__name__)
@@ -110,6 +117,32 @@ def _get_target_url(mode: str) -> str:
 # ---------------------------------------------------------------------------
 # 2) Cloudflare heuristics – wait until main app is ready
 # ---------------------------------------------------------------------------
+# One round-trip readiness probe: no Cloudflare marker (title or challenge
+# frame), app root mounted, and some interactive content present
+_APP_READY_JS = """
+var t = (document.title || '').toLowerCase();
+var cf = t.indexOf('just a moment') !== -1 || t.indexOf('checking your browser') !== -1
+    || !!document.querySelector("iframe[src*='challenges'], iframe[src*='turnstile']");
+return !cf
+    && !!document.querySelector('#main-layout')
+    && !!document.querySelector("main, nav, header, footer, [role='main']");
+"""
+
+
+class _AppReady:
+    """
+    WebDriverWait condition: True once Cloudflare is out of the way and the
+    McLuck app has mounted. Script errors (e.g. mid-navigation) count as
+    "not ready yet" so the wait keeps polling.
+    """
+
+    def __call__(self, driver: WebDriver) -> bool:
+        try:
+            return bool(driver.execute_script(_APP_READY_JS))
+        except WebDriverException:
+            return False
+
+
 def _wait_for_cloudflare_and_app(driver: WebDriver, timeout: int = 90) -> None:
     """
     Heuristically wait out Cloudflare interstitials and the app bootstrap.
@@ -119,41 +152,14 @@ def _wait_for_cloudflare_and_app(driver: WebDriver, timeout: int = 90) -> None:
       - Consider page ready when the app root (#main-layout) appears and the
         main content area is present.
       - Cap the wait to the provided timeout.
-    """
-    end_ts = time.time() + timeout
-
-    # Quick helper: detect common CF challenge markers
-    def cf_in_progress() -> bool:
-        try:
-            title = (driver.title or "").lower()
-        except Exception:
-            title = ""
-        if any(kw in title for kw in ["just a moment", "checking your browser"]):
-            return True
-        try:
-            # Turnstile/challenge frames often include these substrings
-            cf_frames = driver.find_elements(By.CSS_SELECTOR, "iframe[src*='challenges']")
-            if not cf_frames:
-                cf_frames = driver.find_elements(By.CSS_SELECTOR, "iframe[src*='turnstile']")
-            return len(cf_frames) > 0
-        except Exception:
-            return False
 
-    # Loop until either app root is present or timeout
-    while time.time() < end_ts:
-        try:
-            if not cf_in_progress():
-                # App root for McLuck UI
-                root = driver.find_elements(By.CSS_SELECTOR, "#main-layout")
-                if root:
-                    # Also ensure the page has some interactive content mounted
-                    content = driver.find_elements(By.CSS_SELECTOR, "main, nav, header, footer, [role='main']")
-                    if content:
-                        return
-            # Small backoff to avoid busy-waiting
-            time.sleep(0.6)
-        except Exception:
-            time.sleep(0.8)
+    All signals are read by a single script per poll (see _AppReady).
+    """
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.5).until(_AppReady())
+        return
+    except TimeoutException:
+        pass
 
     # If we reach here, we didn't detect readiness; we do not raise hard errors
     # because the app may still be functional. Log a warning so the caller can
@@ -161,9 +167,54 @@ def _wait_for_cloudflare_and_app(driver: WebDriver, timeout: int = 90) -> None:
     log.warning("Cloudflare/app readiness wait timed out after %ss", timeout)
 
 
+def _fast_app_ready(driver: WebDriver, timeout: float = 2) -> bool:
+    """
+    Short readiness check for navigations after Cloudflare was already
+    cleared this session: True if the app is up within *timeout* seconds.
+    """
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.25).until(_AppReady())
+        return True
+    except TimeoutException:
+        return False
+
+
 # ---------------------------------------------------------------------------
 # 3) Login flows – Google or Username/Password
 # ---------------------------------------------------------------------------
+# Selectors shared by the login helpers (built once, reused on every poll)
+_LOGIN_BTN_XPATH = (
+    "//button[contains(translate(., 'SIGNIN', 'signin'), 'sign in') or "
+    "contains(translate(., 'LOGIN', 'login'), 'log in')]"
+)
+_AVATAR_SELECTOR = "[data-test*='avatar'], [class*='avatar'], [class*='profile']"
+_GAME_CANVAS_SELECTOR = ".GameCanvas_root__s_B_r, .GameCanvas_gameCanvas__DzY4w"
+_GOOGLE_BTN_CANDIDATES = (
+    (By.CSS_SELECTOR, "button[aria-label*='Google']"),
+    (By.XPATH, "//button[contains(., 'Google') or contains(@aria-label, 'Google')]"),
+)
+_EMAIL_SELECTORS = (
+    (By.CSS_SELECTOR, "input[type='email']"),
+    (By.CSS_SELECTOR, "input[name='email']"),
+    (By.CSS_SELECTOR, "input[name='username']"),
+)
+_PWD_SELECTORS = (
+    (By.CSS_SELECTOR, "input[type='password']"),
+    (By.CSS_SELECTOR, "input[name='password']"),
+)
+
+# {avatar, login, canvas} presence flags for _is_logged_in; arguments are
+# the avatar selector, login-button XPath and game-canvas selector
+_LOGIN_STATE_JS = """
+return {
+    avatar: document.querySelector(arguments[0]) !== null,
+    login: document.evaluate(arguments[1], document, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null,
+    canvas: document.querySelector(arguments[2]) !== null
+};
+"""
+
+
 def _is_logged_in(driver: WebDriver) -> bool:
     """
     Best-effort detection: determine if the user appears logged in.
@@ -174,15 +225,12 @@ def _is_logged_in(driver: WebDriver) -> bool:
     """
     try:
         # Signs of being logged in: avatar button/menu typically present on
-        # the right; lack of a visible login button.
-        avatar = driver.find_elements(By.CSS_SELECTOR, "[data-test*='avatar'], [class*='avatar'], [class*='profile']")
-        login_buttons = driver.find_elements(By.XPATH, "//button[contains(translate(., 'SIGNIN', 'signin'), 'sign in') or contains(translate(., 'LOGIN', 'login'), 'log in')]")
-        if avatar and not login_buttons:
-            return True
-        # Also consider presence of the game canvas as a strong signal
-        game_canvas = driver.find_elements(By.CSS_SELECTOR, ".GameCanvas_root__s_B_r, .GameCanvas_gameCanvas__DzY4w")
-        if game_canvas:
-            return True
+        # the right; lack of a visible login button. Also consider presence of
+        # the game canvas as a strong signal. All three probed in one script.
+        state = driver.execute_script(
+            _LOGIN_STATE_JS, _AVATAR_SELECTOR, _LOGIN_BTN_XPATH, _GAME_CANVAS_SELECTOR
+        )
+        return bool(state['canvas'] or (state['avatar'] and not state['login']))
     except Exception:
         pass
     return False
@@ -199,14 +247,11 @@ def _try_google_login(driver: WebDriver, email: str, password: str, max_wait: in
       4) Return to the original window
     Returns True on apparent success; False otherwise.
     """
+    parent_handle = None
     try:
         # Locate a Google continue button by common attributes/text.
-        candidates = [
-            (By.CSS_SELECTOR, "button[aria-label*='Google']"),
-            (By.XPATH, "//button[contains(., 'Google') or contains(@aria-label, 'Google')]")
-        ]
         google_btn = None
-        for by, sel in candidates:
+        for by, sel in _GOOGLE_BTN_CANDIDATES:
             elems = driver.find_elements(by, sel)
             if elems:
                 google_btn = elems[0]
@@ -245,11 +290,11 @@ def _try_google_login(driver: WebDriver, email: str, password: str, max_wait: in
     except Exception as exc:
         log.warning("Google login flow failed: %s", exc)
         # Best-effort: return to original window if possible
-        try:
-            for h in driver.window_handles:
-                driver.switch_to.window(h)
-        except Exception:
-            pass
+        if parent_handle is not None:
+            try:
+                driver.switch_to.window(parent_handle)
+            except Exception:
+                pass
         return False
 
 
@@ -260,7 +305,7 @@ def _try_password_login(driver: WebDriver, email: str, password: str, max_wait:
     """
     try:
         # Navigate to a login form if a login button is present
-        possible_login_buttons = driver.find_elements(By.XPATH, "//button[contains(translate(., 'SIGNIN', 'signin'), 'sign in') or contains(translate(., 'LOGIN', 'login'), 'log in')]")
+        possible_login_buttons = driver.find_elements(By.XPATH, _LOGIN_BTN_XPATH)
         if possible_login_buttons:
             try:
                 possible_login_buttons[0].click()
@@ -269,13 +314,8 @@ def _try_password_login(driver: WebDriver, email: str, password: str, max_wait:
                 pass
 
         # Locate email/username field
-        email_selectors = [
-            (By.CSS_SELECTOR, "input[type='email']"),
-            (By.CSS_SELECTOR, "input[name='email']"),
-            (By.CSS_SELECTOR, "input[name='username']"),
-        ]
         email_el = None
-        for by, sel in email_selectors:
+        for by, sel in _EMAIL_SELECTORS:
             elems = driver.find_elements(by, sel)
             if elems:
                 email_el = elems[0]
@@ -286,12 +326,8 @@ def _try_password_login(driver: WebDriver, email: str, password: str, max_wait:
         email_el.send_keys(email)
 
         # Locate password field
-        pwd_selectors = [
-            (By.CSS_SELECTOR, "input[type='password']"),
-            (By.CSS_SELECTOR, "input[name='password']"),
-        ]
         pwd_el = None
-        for by, sel in pwd_selectors:
+        for by, sel in _PWD_SELECTORS:
             elems = driver.find_elements(by, sel)
             if elems:
                 pwd_el = elems[0]
@@ -318,6 +354,30 @@ def _try_password_login(driver: WebDriver, email: str, password: str, max_wait:
         return False
 
 
+class _HandshakeState:
+    """
+    WebDriverWait condition for the Google handshake: ('new', [handles]) once
+    a popup window appears, ('oauth', url) when the current tab is on a
+    Google accounts/OAuth page, otherwise False (keep polling).
+    """
+
+    def __init__(self, prev_handles: set):
+        self.prev_handles = prev_handles
+
+    def __call__(self, driver: WebDriver):
+        new_handles = [h for h in driver.window_handles if h not in self.prev_handles]
+        if new_handles:
+            return "new", new_handles
+        # Same-tab flow: detect Google accounts or auth redirect
+        try:
+            url = driver.current_url
+        except WebDriverException:
+            return False
+        if "accounts.google" in url or "/signin/oauth" in url:
+            return "oauth", url
+        return False
+
+
 def _try_google_handshake_without_credentials(driver: WebDriver, max_wait: int = 30) -> bool:
     """
     When a real Brave profile is loaded, McLuck's "Continue with Google"
@@ -329,12 +389,8 @@ def _try_google_handshake_without_credentials(driver: WebDriver, max_wait: int =
     """
     try:
         # Find a Google continue button
-        candidates = [
-            (By.CSS_SELECTOR, "button[aria-label*='Google']"),
-            (By.XPATH, "//button[contains(., 'Google') or contains(@aria-label, 'Google')]")
-        ]
         google_btn = None
-        for by, sel in candidates:
+        for by, sel in _GOOGLE_BTN_CANDIDATES:
             elems = driver.find_elements(by, sel)
             if elems:
                 google_btn = elems[0]
@@ -347,25 +403,19 @@ def _try_google_handshake_without_credentials(driver: WebDriver, max_wait: int =
         google_btn.click()
 
         # Wait briefly for either a new window or same-tab redirect
-        t_end = time.time() + max_wait
         switched = False
-        while time.time() < t_end:
-            cur_handles = set(driver.window_handles)
-            new_handles = list(cur_handles - prev_handles)
-            if new_handles:
-                driver.switch_to.window(new_handles[-1])
-                switched = True
-                break
-            # Same-tab flow: detect Google accounts or auth redirect
-            try:
-                url = driver.current_url
-                if "accounts.google" in url or "/signin/oauth" in url:
-                    # Let it settle; with a real profile it should bounce back quickly
-                    time.sleep(1.0)
-                    break
-            except Exception:
-                pass
-            time.sleep(0.3)
+        try:
+            kind, value = WebDriverWait(driver, max_wait, poll_frequency=0.25).until(
+                _HandshakeState(prev_handles)
+            )
+        except TimeoutException:
+            kind, value = None, None
+        if kind == "new":
+            driver.switch_to.window(value[-1])
+            switched = True
+        elif kind == "oauth":
+            # Let it settle; with a real profile it should bounce back quickly
+            time.sleep(1.0)
 
         # Give the OAuth a moment to complete
         time.sleep(2.0)
@@ -433,6 +483,57 @@ def _ensure_logged_in(driver: WebDriver) -> None:
         log.info("Automated login not completed – manual login may be required.")
 
 
+def _session_file() -> str:
+    """Path of the saved-cookies file (MCLUCK_SESSION_FILE overrides)."""
+    return os.getenv("MCLUCK_SESSION_FILE") or ".mcluck_session.json"
+
+
+def _save_session(driver: WebDriver) -> None:
+    """
+    Persist the current page's cookies so the next run can skip the login
+    flow. Must be called from the top-level McLuck page (not an iframe),
+    since cookies are scoped to the current document's domain.
+    """
+    path = _session_file()
+    try:
+        cookies = driver.get_cookies()
+        # Session cookies are credentials – keep the file private
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(cookies, fh)
+        log.info("Saved %d session cookies to %s", len(cookies), path)
+    except Exception as e:
+        log.warning("Could not save session cookies: %s", e)
+
+
+def _load_session(driver: WebDriver) -> bool:
+    """
+    Replay cookies saved by _save_session() into the current McLuck page.
+    Returns True if any cookie was added (the caller should then refresh).
+    """
+    path = _session_file()
+    if not os.path.isfile(path):
+        return False
+    try:
+        with open(path, encoding="utf-8") as fh:
+            cookies = json.load(fh)
+    except Exception as e:
+        log.warning("Could not read session cookies from %s: %s", path, e)
+        return False
+
+    added = 0
+    for cookie in cookies:
+        try:
+            driver.add_cookie(cookie)
+            added += 1
+        except WebDriverException:
+            # Expired or foreign-domain cookies are rejected – skip them
+            pass
+    if added:
+        log.info("Restored %d session cookies from %s", added, path)
+    return added > 0
+
+
 # ---------------------------------------------------------------------------
 # 4) Ensure correct page and navigate to nested iframes
 # ---------------------------------------------------------------------------
@@ -447,10 +548,21 @@ def _ensure_on_target_page(driver: WebDriver, target_url: str) -> None:
         expected_path_hint = "/games/slots/aloha-king-elvis/"
         if not current.startswith(expected_base) or expected_path_hint not in current:
             driver.get(target_url)
-            _wait_for_cloudflare_and_app(driver, timeout=60)
+            # CF clearance persists in cookies – only fall back to the long
+            # wait when the app isn't up almost immediately
+            if not _fast_app_ready(driver):
+                _wait_for_cloudflare_and_app(driver, timeout=60)
     except Exception:
         driver.get(target_url)
-        _wait_for_cloudflare_and_app(driver, timeout=60)
+        if not _fast_app_ready(driver):
+            _wait_for_cloudflare_and_app(driver, timeout=60)
+
+
+# Canvas root, outer game iframe or any app iframe present – one query per poll
+_GAME_CANVAS_READY_JS = (
+    "return !!document.querySelector('.GameCanvas_root__s_B_r, .GameCanvas_gameCanvas__DzY4w, "
+    "iframe.GameCanvas_iframe__h40la, #main-layout iframe');"
+)
 
 
 def _wait_game_canvas_ready(driver: WebDriver, timeout: int = 45) -> bool:
@@ -459,23 +571,53 @@ def _wait_game_canvas_ready(driver: WebDriver, timeout: int = 45) -> bool:
     Returns True if a plausible game canvas or outer iframe appears.
     """
     try:
-        WebDriverWait(driver, timeout).until(
-            EC.any_of(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".GameCanvas_root__s_B_r, .GameCanvas_gameCanvas__DzY4w")),
-                EC.presence_of_element_located((By.CSS_SELECTOR, "iframe.GameCanvas_iframe__h40la")),
-                EC.presence_of_element_located((By.CSS_SELECTOR, "#main-layout iframe")),
-            )
+        WebDriverWait(driver, timeout, poll_frequency=0.4).until(
+            lambda d: d.execute_script(_GAME_CANVAS_READY_JS)
         )
         return True
     except TimeoutException:
         return False
 
 
+# Outer game iframe: its own class first; the long layout path (brittle and
+# slow to match) plus a loose canvas-root match only as a fallback
+_OUTER_IFRAME_SELECTOR = "iframe.GameCanvas_iframe__h40la"
+_OUTER_IFRAME_FALLBACK_SELECTOR = (
+    "#main-layout > main > div > div > div > div > div > div."
+    "GameCanvas_root__s_B_r.GameCanvas_gameCanvas__DzY4w > div > div > iframe, "
+    ".GameCanvas_root__s_B_r iframe"
+)
+# How long the direct class match gets before the fallback takes over; the
+# fallback gets the rest of outer_wait
+_OUTER_IFRAME_PRIMARY_WAIT = 10
+
+
+class _FrameSwitched:
+    """
+    WebDriverWait condition: locate the iframe matching *css* and switch into
+    it in the same poll, returning the element.  A frame re-rendered between
+    locate and switch (stale element / no such frame) counts as "not yet",
+    as with EC.frame_to_be_available_and_switch_to_it.
+    """
+
+    def __init__(self, css: str):
+        self.css = css
+
+    def __call__(self, driver: WebDriver):
+        try:
+            frame_el = driver.find_element(By.CSS_SELECTOR, self.css)
+            driver.switch_to.frame(frame_el)
+            return frame_el
+        except (NoSuchElementException, StaleElementReferenceException, NoSuchFrameException):
+            return False
+
+
 def _switch_to_required_iframes(driver: WebDriver, outer_wait: int = 40, inner_wait: int = 40) -> Tuple[bool, bool]:
     """
     Wait for and switch into the two required iframes in sequence.
 
-    Outer iframe selector (provided by user):
+    Outer iframe: matched directly by its class (iframe.GameCanvas_iframe__h40la)
+    for up to 10s; the full path provided by user is only a fallback:
       #main-layout > main > div > div > div > div > div > div.GameCanvas_root__s_B_r.GameCanvas_gameCanvas__DzY4w > div > div > iframe
 
     Inner iframe example (provided by user):
@@ -483,40 +625,28 @@ def _switch_to_required_iframes(driver: WebDriver, outer_wait: int = 40, inner_w
 
     Returns (outer_ok, inner_ok) indicating whether each switch succeeded.
     """
-    outer_selector = (
-        "#main-layout > main > div > div > div > div > div > div."
-        "GameCanvas_root__s_B_r.GameCanvas_gameCanvas__DzY4w > div > div > iframe"
-    )
-
+    primary_wait = min(outer_wait, _OUTER_IFRAME_PRIMARY_WAIT)
     try:
-        outer_iframe = WebDriverWait(driver, outer_wait).until(
-            EC.frame_to_be_available_and_switch_to_it((By.CSS_SELECTOR, outer_selector))
-        )
-        outer_ok = True
+        # Direct class match – cheap for the selector engine on every poll
+        WebDriverWait(driver, primary_wait).until(_FrameSwitched(_OUTER_IFRAME_SELECTOR))
     except TimeoutException:
-        # Fallback: locate by class more loosely
+        # Fallback: the full layout path, or any iframe under the canvas root
         try:
-            outer = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".GameCanvas_iframe__h40la, .GameCanvas_root__s_B_r iframe"))
+            WebDriverWait(driver, max(outer_wait - primary_wait, 10)).until(
+                _FrameSwitched(_OUTER_IFRAME_FALLBACK_SELECTOR)
             )
-            driver.switch_to.frame(outer)
-            outer_ok = True
         except Exception:
             log.error("Failed to locate/switch to outer game iframe.")
             return False, False
 
     # Inner iframe – prefer class, fallback to src contains gamma.interlayer.work
     try:
-        WebDriverWait(driver, inner_wait).until(
-            EC.frame_to_be_available_and_switch_to_it((By.CSS_SELECTOR, "iframe.styles_root__frK1Y"))
-        )
-        inner_ok = True
+        WebDriverWait(driver, inner_wait).until(_FrameSwitched("iframe.styles_root__frK1Y"))
     except TimeoutException:
         try:
             WebDriverWait(driver, 15).until(
-                EC.frame_to_be_available_and_switch_to_it((By.CSS_SELECTOR, "iframe[src*='gamma.interlayer.work/games/AlohaKingElvis']"))
+                _FrameSwitched("iframe[src*='gamma.interlayer.work/games/AlohaKingElvis']")
             )
-            inner_ok = True
         except Exception:
             log.error("Failed to locate/switch to inner game iframe.")
             # Important: return to default content so callers are not stuck inside a partial frame
@@ -532,23 +662,26 @@ def _switch_to_required_iframes(driver: WebDriver, outer_wait: int = 40, inner_w
 # ---------------------------------------------------------------------------
 # 5) CDP network capture – reconstruct curl for gamma API calls
 # ---------------------------------------------------------------------------
+# Headers copied into reconstructed curl commands, in output order
+_CURL_HEADER_ORDER = (
+    'accept', 'accept-language', 'content-type', 'origin', 'priority', 'referer',
+    'sec-ch-ua', 'sec-ch-ua-mobile', 'sec-ch-ua-platform', 'sec-fetch-dest',
+    'sec-fetch-mode', 'sec-fetch-site', 'sec-fetch-storage-access', 'sec-gpc',
+    'user-agent', 'x-csrf-token',
+)
+
+
 def _build_curl_command(url: str, method: str, headers: dict, body: Optional[str]) -> str:
     """
     Build a curl command string using key headers in stable order.
     Only includes headers that are present in the captured request.
     """
-    wanted = [
-        'accept', 'accept-language', 'content-type', 'origin', 'priority', 'referer',
-        'sec-ch-ua', 'sec-ch-ua-mobile', 'sec-ch-ua-platform', 'sec-fetch-dest',
-        'sec-fetch-mode', 'sec-fetch-site', 'sec-fetch-storage-access', 'sec-gpc',
-        'user-agent', 'x-csrf-token'
-    ]
     parts = ["curl", f"'{url}'"]
     if method and method.upper() != 'GET':
         parts.insert(1, "-X")
         parts.insert(2, method.upper())
     lower_headers = {k.lower(): v for k, v in (headers or {}).items()}
-    for key in wanted:
+    for key in _CURL_HEADER_ORDER:
         if key in lower_headers:
             parts.append(f"-H '{key}: {lower_headers[key]}'")
     if body:
@@ -632,10 +765,22 @@ def enable_iframe_request_capture(driver: WebDriver) -> None:
         log.warning("Failed to install iframe request capture: %s", e)
 
 
+# Drain captured requests, or null when the hook is not installed in the
+# current frame – one command per poll covers both checks
+_REQCAP_DRAIN_JS = "return window.__reqCapDrain ? window.__reqCapDrain() : null;"
+
+# Upper bound for the capture poll interval while no requests arrive
+_CAPTURE_IDLE_MAX_INTERVAL = 2.0
+
+
 def _start_background_capture_printer(driver: WebDriver, poll_interval: float = None) -> None:
     """
-    Start a lightweight background thread that polls window.__reqCapGet() inside
-    the inner iframe and prints a reconstructed curl for new requests.
+    Start a lightweight background thread that drains window.__reqCapDrain()
+    inside the inner iframe and prints a reconstructed curl for new requests.
+
+    The poll interval doubles on each empty drain (up to
+    _CAPTURE_IDLE_MAX_INTERVAL) and resets when requests arrive, so an idle
+    game costs roughly one WebDriver command every couple of seconds.
     """
     # Allow tuning via environment; default 0.2s
     if poll_interval is None:
@@ -646,20 +791,29 @@ def _start_background_capture_printer(driver: WebDriver, poll_interval: float =
             poll_interval = 0.2
 
     def loop():
+        interval = poll_interval
+        # Local bindings – this loop runs for the whole session
+        _exec = driver.execute_script
+        _sleep = time.sleep
         while getattr(driver, "_reqcap_poll", True):
             try:
-                # Reinstall hook if iframe reloaded
+                # Drain items atomically to avoid duplicates/misses; None means
+                # the hook is gone (iframe reloaded) and must be reinstalled
                 with driver._reqcap_lock:
-                    installed = driver.execute_script("return !!(window.__reqCapInstalled);")
-                if not installed:
+                    items = _exec(_REQCAP_DRAIN_JS)
+                if items is None:
                     try:
                         enable_iframe_request_capture(driver)
                     except Exception:
                         pass
+                    items = []
 
-                # Drain items atomically to avoid duplicates/misses
-                with driver._reqcap_lock:
-                    items = driver.execute_script("return (window.__reqCapDrain && window.__reqCapDrain()) || [];") or []
+                # Back off while the game is idle so the thread doesn't keep
+                # the driver busy; snap back to the base rate on activity
+                if items:
+                    interval = poll_interval
+                else:
+                    interval = min(interval * 2, max(poll_interval, _CAPTURE_IDLE_MAX_INTERVAL))
                 if items:
                     for rec in items:
                         url = rec.get('url','')
@@ -743,7 +897,7 @@ def _start_background_capture_printer(driver: WebDriver, poll_interval: float =
                             pass
             except Exception:
                 pass
-            time.sleep(poll_interval)
+            _sleep(interval)
 
     try:
         driver._reqcap_poll = True
@@ -791,6 +945,12 @@ def launch_and_authenticate(mode: Optional[str] = None) -> WebDriver:
     driver.get(target_url)
     _wait_for_cloudflare_and_app(driver, timeout=90)
 
+    # Rehydrate a saved session so the login flow below is usually a no-op
+    if not _is_logged_in(driver) and _load_session(driver):
+        driver.refresh()
+        if not _fast_app_ready(driver):
+            _wait_for_cloudflare_and_app(driver, timeout=60)
+
     # Ensure we are authenticated. With a real Brave profile we attempt a
     # credential-less Google handshake; otherwise we try provided credentials.
     _ensure_logged_in(driver)
@@ -801,6 +961,10 @@ def launch_and_authenticate(mode: Optional[str] = None) -> WebDriver:
     # Ensure the game canvas is ready before switching into iframes
     _wait_game_canvas_ready(driver, timeout=60)
 
+    # Still on the top-level page: persist the authenticated session
+    if _is_logged_in(driver):
+        _save_session(driver)
+
     # Wait for nested iframes and switch into them, with a single retry path
     outer_ok, inner_ok = _switch_to_required_iframes(driver)
     # Start JS-based capture in the inner iframe